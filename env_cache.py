@@ -0,0 +1,114 @@
+"""
+Cached .env loading.
+
+config.py and every auth/diagnostic script used to call load_dotenv() at
+import time, so the .env file was re-parsed once per importing module.
+load_env() parses it once per process and returns the merged environment
+as a plain dict; the cache invalidates automatically when .env changes on
+disk (mtime check), e.g. after auth_tiktok.py saves a new token.
+
+Process environment variables take precedence over .env values, matching
+the os.getenv() behavior the rest of the code relies on.
+"""
+
+import os
+import re
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+# The .env file lives in the project root (same as before)
+ENV_FILE = ".env"
+
+# os.environ as it stood before any .env mirroring. Overlaying the live
+# os.environ instead would let values an earlier load copied in from
+# .env shadow fresh ones after the file changes on disk - discarding
+# exactly the re-read the mtime invalidation below exists to provide.
+# Only variables the user actually exported take precedence.
+_REAL_ENV = dict(os.environ)
+
+
+@lru_cache(maxsize=1)
+def _load_env(mtime_ns: int) -> dict:
+    values = {key: value for key, value in dotenv_values(ENV_FILE).items()
+              if value is not None}
+    # Mirror .env into os.environ for modules that still call
+    # os.getenv() - refreshed values included, real environment
+    # variables never clobbered
+    for key, value in values.items():
+        if key not in _REAL_ENV:
+            os.environ[key] = value
+    return {**values, **_REAL_ENV}
+
+
+def load_env() -> dict:
+    """
+    Return the merged .env + process environment, parsed at most once.
+
+    Returns:
+        Dictionary of environment variables (str -> str)
+    """
+    try:
+        mtime_ns = os.stat(ENV_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = 0  # No .env file - process environment only
+    return _load_env(mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _kv_pattern(keys: tuple) -> "re.Pattern":
+    """Precompiled KEY=... line matcher for a given set of keys."""
+    alternation = "|".join(re.escape(key) for key in keys)
+    return re.compile(rf"^({alternation})=.*$", re.MULTILINE)
+
+
+def update_env(path, updates: dict):
+    """
+    Update KEY=value lines in a .env file in a single pass.
+
+    Reads the file once, substitutes every matching line with one
+    precompiled-regex pass (instead of split/iterate/join per key),
+    appends any keys that were not already present, and writes the result
+    atomically via a temp file + os.replace so a crash mid-write can't
+    truncate the file.
+
+    Args:
+        path: Path to the .env file
+        updates: Mapping of key -> new value
+    """
+    if not updates:
+        return
+
+    path = Path(path)
+    text = path.read_text() if path.exists() else ""
+
+    seen = set()
+
+    def _substitute(match):
+        key = match.group(1)
+        seen.add(key)
+        return f"{key}={updates[key]}"
+
+    text = _kv_pattern(tuple(sorted(updates))).sub(_substitute, text)
+
+    # Append keys that had no existing line
+    missing = [key for key in updates if key not in seen]
+    if missing:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        text += "".join(f"{key}={updates[key]}\n" for key in missing)
+
+    # Atomic write: temp file in the same directory, then replace
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".env.tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
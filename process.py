@@ -9,25 +9,215 @@ This script:
 2. Exports YouTube videos in original format (landscape, full length)
 3. Converts Instagram videos to vertical 9:16 format (1080x1920, full length)
 4. Converts TikTok videos to vertical 9:16 format (1080x1920, full length)
-5. Adds CTA overlay with Amazon creator link (currently disabled)
+5. Adds CTA overlay with Amazon creator link (off by default - see below)
 6. Exports to platform-specific folders
 7. Generates metadata files for each platform
+
+With CTA_ENABLED off (the default) no MoviePy clip is ever built: scaling,
+letterboxing, CFR normalization and all platform encodes run as native
+ffmpeg filter-graph work in a single fan-out invocation, which avoids the
+per-frame Python compositing path entirely. Setting CTA_ENABLED=true in
+.env switches to the MoviePy pipeline so the overlay can be burned in.
 """
 
+from __future__ import annotations
+
 import argparse
+import errno
 import json
+from bisect import bisect
+import logging
+import multiprocessing
+import os
+import re
 import shutil
+import subprocess
+import threading
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from moviepy import VideoFileClip, TextClip, CompositeVideoClip, ColorClip
+from typing import TYPE_CHECKING
 import config
 
-# Import uploaders (optional - only if upload is enabled)
+# moviepy drags in numpy/PIL/imageio at import time (around a second of
+# cold start), so it's imported inside the functions that touch clips.
+# 'python process.py --help' shouldn't pay for the video stack.
+if TYPE_CHECKING:
+    from moviepy import VideoFileClip, TextClip, CompositeVideoClip
+
+# orjson serializes several times faster than stdlib json (C extension);
+# optional - metadata writes fall back to json.dump when it isn't installed
 try:
-    from uploaders import YouTubeUploader, InstagramUploader, TikTokUploader
-    UPLOADERS_AVAILABLE = True
+    import orjson
 except ImportError:
-    UPLOADERS_AVAILABLE = False
+    orjson = None
+
+
+def _detect_video_encoder() -> str:
+    """
+    Pick the fastest available H.264 encoder.
+
+    Runs a tiny test encode per hardware candidate (NVENC on NVIDIA, Quick
+    Sync on Intel) so we only select encoders that actually work on this
+    machine - ffmpeg listing an encoder doesn't guarantee the GPU/driver is
+    usable. Hardware encoders run on fixed-function silicon and cut export
+    wall time several-fold; libx264 is the safe CPU fallback.
+
+    The result is published through the environment so batch worker
+    processes inherit it instead of each re-running the test encodes.
+    These probes (and the per-export ffmpeg spawn inside MoviePy's
+    writer) are the only repeated process spawns in the pipeline; the
+    writer's own spawn is a few tens of ms against encodes that run for
+    seconds to minutes, so it isn't worth a persistent worker protocol.
+    """
+    # Explicit override from .env wins and skips the probes entirely
+    if config.ENCODER != "auto":
+        return config.ENCODER
+
+    cached = os.environ.get("_DETECTED_VIDEO_CODEC")
+    if cached:
+        return cached
+
+    codec = "libx264"
+    for candidate in ("h264_nvenc", "h264_qsv"):
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-v", "error",
+                    "-f", "lavfi", "-i", "color=size=64x64:rate=30:duration=0.1",
+                    "-c:v", candidate, "-f", "null", "-"
+                ],
+                capture_output=True,
+                timeout=15
+            )
+            if result.returncode == 0:
+                codec = candidate
+                break
+        except (OSError, subprocess.SubprocessError):
+            break  # ffmpeg missing/broken - let MoviePy handle it with libx264
+
+    os.environ["_DETECTED_VIDEO_CODEC"] = codec
+    return codec
+
+
+# Detected once at import; all exports in this run use the same encoder
+VIDEO_CODEC = _detect_video_encoder()
+
+# Hardware encoders use their own preset names (NVENC: p1-p7, QSV: x264-like)
+_HW_PRESETS = {
+    "h264_nvenc": "p4",
+    "hevc_nvenc": "p4",
+    "h264_qsv": "fast",
+}
+
+# Extensions (without dot) accepted by batch processing
+VIDEO_EXTENSIONS = frozenset({'mp4', 'mov', 'avi', 'mkv', 'm4v'})
+
+# Encoder thread count for every ffmpeg invocation, computed once (x264
+# scales poorly past ~8 threads, and cpu_count() doesn't change mid-run)
+NUM_ENCODER_THREADS = min(multiprocessing.cpu_count(), 8)
+
+# Common ffmpeg argument groups for the MoviePy export path, built once.
+# Tuples at module scope make the per-platform diff obvious and replace
+# the old append-then-filter '-g' dance (which left a stray '30' in the
+# argument list). fps-dependent args ('-g') are appended per call.
+_FFMPEG_PARAMS_BASE = (
+    '-movflags', '+faststart',  # Enable fast start for web playback
+    '-pix_fmt', 'yuv420p',  # Ensure compatibility
+    '-profile:v', 'high',  # Use high profile for better quality
+    '-level', '4.0',  # H.264 level 4.0 for compatibility
+    '-bf', '2',  # B-frames for better compression
+)
+
+# Extra x264-only quality flags for the vertical (Instagram/TikTok)
+# renditions - hardware encoders reject these
+_FFMPEG_PARAMS_MOBILE = (
+    '-rc-lookahead', '30',  # Lookahead for better quality
+    '-refs', '3',  # Reference frames for better quality
+    '-trellis', '1',  # Trellis quantization for better quality
+)
+
+
+def probe(path: Path) -> dict:
+    """
+    Read container and stream info with a single ffprobe call.
+
+    Parsing the container headers costs a few milliseconds versus the
+    hundreds MoviePy spends initializing its decoder, so this lets
+    process_video reject unreadable files and log dimensions/duration
+    before committing to the full VideoFileClip open.
+
+    Args:
+        path: Path to the video file
+
+    Returns:
+        Parsed ffprobe JSON ({'streams': [...], 'format': {...}}), or {}
+        if ffprobe is unavailable or the file can't be parsed
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-print_format', 'json',
+             '-show_streams', '-show_format', str(path)],
+            capture_output=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            return {}
+        return json.loads(result.stdout)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return {}
+
+# Uploader class per platform, resolved lazily through the uploaders
+# package so only the SDK stacks for configured platforms ever load
+_UPLOADER_CLASS_NAMES = {
+    'youtube': 'YouTubeUploader',
+    'instagram': 'InstagramUploader',
+    'tiktok': 'TikTokUploader',
+}
+
+
+def _uploaders_available() -> bool:
+    """
+    True when the upload SDKs for the configured platforms are importable.
+
+    Checked (and imported) only when AUTO_UPLOAD_ENABLED - processing-only
+    runs never pay for the Google/AWS client imports. The uploaders
+    package imports lazily, so each getattr here pulls in exactly one
+    platform's stack.
+    """
+    try:
+        import uploaders
+        for platform in config.UPLOAD_PLATFORMS:
+            class_name = _UPLOADER_CLASS_NAMES.get(platform)
+            if class_name:
+                getattr(uploaders, class_name)
+        return True
+    except ImportError:
+        return False
+
+
+# Candidate CFR output rates with precomputed bucket boundaries - the
+# nearest-rate pick is a bisect into the midpoints instead of a min()
+# scan that rebuilt the list and allocated a lambda on every call
+_COMMON_FPS = (23.976, 24.0, 25.0, 29.97, 30.0, 60.0)
+_COMMON_FPS_MIDPOINTS = tuple(
+    (lo + hi) / 2 for lo, hi in zip(_COMMON_FPS, _COMMON_FPS[1:])
+)
+
+
+def choose_normalized_fps(original_fps: float) -> float:
+    """
+    Pick the CFR output rate for a (possibly VFR) source frame rate.
+
+    Rounds to the nearest common frame rate (23.976, 24, 25, 29.97, 30,
+    60) when close, to absorb the slight variations phone recordings
+    report; otherwise keeps the original rate rounded to 2 decimals.
+    """
+    target_fps = _COMMON_FPS[bisect(_COMMON_FPS_MIDPOINTS, original_fps)]
+    if abs(original_fps - target_fps) < 0.5:
+        return target_fps
+    return round(original_fps, 2)
 
 
 def normalize_video(clip: VideoFileClip) -> VideoFileClip:
@@ -50,39 +240,36 @@ def normalize_video(clip: VideoFileClip) -> VideoFileClip:
     # Convert to CFR (Constant Frame Rate) to fix sync issues
     # Use set_fps with change_duration=False to preserve audio sync
     print(f"  Original FPS: {original_fps:.2f}")
-    
-    # Round to nearest common frame rate (23.976, 24, 25, 29.97, 30, 60)
-    # This handles slight variations in phone recordings
-    common_fps = [23.976, 24, 25, 29.97, 30, 60]
-    target_fps = min(common_fps, key=lambda x: abs(x - original_fps))
-    
-    # If close to a common FPS, use that; otherwise use the original
-    if abs(original_fps - target_fps) < 0.5:
-        normalized_fps = target_fps
-    else:
-        # Use original FPS, rounded to 2 decimals
-        normalized_fps = round(original_fps, 2)
+
+    # Round to nearest common frame rate (handles slight variations in
+    # phone recordings); same policy as the direct-ffmpeg path
+    normalized_fps = choose_normalized_fps(original_fps)
     
     # Convert VFR to CFR while preserving audio sync
     # change_duration=False ensures audio timing stays correct
-    if abs(clip.fps - normalized_fps) > 0.01:  # Only convert if significantly different
+    if abs(original_fps - normalized_fps) > 0.01:  # Only convert if significantly different
         print(f"  Converting VFR to CFR: {original_fps:.2f} → {normalized_fps:.2f} fps")
         clip = clip.set_fps(normalized_fps, change_duration=False)
         print(f"  [OK] Frame rate normalized (audio sync preserved)")
     else:
         print(f"  [OK] Frame rate is already constant ({normalized_fps:.2f} fps)")
-    
-    # Ensure audio is present and properly synced
-    if clip.audio is None:
+
+    # Ensure audio is present and properly synced (read the audio clip and
+    # durations once - each access walks MoviePy's reader attributes)
+    audio = clip.audio
+    if audio is None:
         print("  Warning: Input video has no audio track.")
     else:
         # Explicitly ensure audio is set to match video duration
         # This prevents audio drift during processing
-        if abs(clip.audio.duration - clip.duration) > 0.1:
-            print(f"  Warning: Audio duration ({clip.audio.duration:.2f}s) doesn't match video ({clip.duration:.2f}s)")
-            print(f"  Adjusting audio to match video duration...")
-            clip = clip.set_audio(clip.audio.set_duration(clip.duration))
-    
+        video_duration = clip.duration
+        audio_duration = audio.duration
+        if abs(audio_duration - video_duration) > 0.1:
+            # Warning only: export passes '-async 1', so ffmpeg corrects
+            # the drift at mux time without a Python-level re-timestamp
+            print(f"  Warning: Audio duration ({audio_duration:.2f}s) doesn't match video ({video_duration:.2f}s)")
+            print(f"  ffmpeg will resync audio at export (-async 1)")
+
     return clip
 
 
@@ -121,77 +308,112 @@ def extract_clip_segment(clip: VideoFileClip, start_time: float = None,
 def convert_to_vertical(clip: VideoFileClip) -> VideoFileClip:
     """
     Convert video to vertical 9:16 format (1080x1920).
-    
+
     Strategy: Scale to fit (minimizes cropping and zoom)
     - Scales video to fit within target dimensions while maintaining aspect ratio
     - Adds letterboxing/pillarboxing if needed (black bars)
     - This prevents important content from being cropped out
-    
+
+    The resize and the letterbox are fused into one resized() + Margin()
+    pass. The previous ColorClip + CompositeVideoClip approach rebuilt a
+    full 1080x1920 background frame and blitted the video onto it every
+    frame; Margin just pads the scaled frame with black bars in a single
+    buffer operation, so far fewer bytes cross the Python/numpy boundary.
+
     Args:
         clip: Input video clip
-        
+
     Returns:
         Vertical video clip (1080x1920)
     """
     target_width = config.TARGET_WIDTH
     target_height = config.TARGET_HEIGHT
-    target_aspect = target_width / target_height  # 9:16 = 0.5625
-    
+
     current_width = clip.w
     current_height = clip.h
-    current_aspect = current_width / current_height
-    
-    # Calculate scale factor to fit video within target dimensions
-    # We want to scale so the video fits completely within the target frame
-    scale_by_width = target_width / current_width
-    scale_by_height = target_height / current_height
-    
-    # Use the smaller scale factor to ensure video fits completely
-    scale_factor = min(scale_by_width, scale_by_height)
-    
-    # Calculate new dimensions after scaling
-    new_width = int(current_width * scale_factor)
-    new_height = int(current_height * scale_factor)
-    
+
+    # Scale to fit: one cross-multiplied aspect comparison picks the
+    # binding dimension, which is pinned exactly to the target (the old
+    # float scale-factor truncated both axes, leaving e.g. 1079px widths
+    # that forced an extra pixel of padding)
+    if current_width * target_height >= current_height * target_width:
+        # Source is wider than 9:16 - width binds, bars go top/bottom
+        new_width = target_width
+        new_height = round(current_height * target_width / current_width)
+    else:
+        # Source is taller/narrower - height binds, bars go left/right
+        new_height = target_height
+        new_width = round(current_width * target_height / current_height)
+
+    from moviepy import vfx
+
     # Resize video (this will fit within target dimensions)
     scaled_clip = clip.resized(new_size=(new_width, new_height))
-    
-    # Create a black background at target size
-    background = ColorClip(size=(target_width, target_height), color=(0, 0, 0), duration=clip.duration)
-    
-    # Center the scaled video on the black background
-    # Calculate position to center the video
-    x_center = (target_width - new_width) // 2
-    y_center = (target_height - new_height) // 2
-    
-    # Composite the scaled video on the background
-    final_clip = CompositeVideoClip(
-        [background, scaled_clip.with_position((x_center, y_center))],
-        size=(target_width, target_height)
-    )
-    
+
+    # Pad out to the exact target size with centered black bars
+    pad_x = target_width - new_width
+    pad_y = target_height - new_height
+
+    final_clip = scaled_clip.with_effects([vfx.Margin(
+        left=pad_x // 2,
+        right=pad_x - pad_x // 2,
+        top=pad_y // 2,
+        bottom=pad_y - pad_y // 2,
+        color=(0, 0, 0)
+    )])
+
     return final_clip
 
 
+# Rendered CTA text bitmaps, keyed by clip width. The CTA text/font/colors
+# are constant for a run, so the expensive Pillow text layout inside TextClip
+# runs once per output width and is reused across every video in a batch.
+_cta_text_cache = {}
+
+
+def _get_cta_text_clip(width: int) -> TextClip:
+    """
+    Build (or fetch the cached) static CTA text clip for a given width.
+
+    Args:
+        width: Target clip width in pixels
+
+    Returns:
+        Rendered TextClip (no duration/position set - callers apply those)
+    """
+    txt_clip = _cta_text_cache.get(width)
+    if txt_clip is None:
+        from moviepy import TextClip
+
+        # Create text clip for CTA (MoviePy 2.x uses font_size instead of fontsize)
+        txt_clip = TextClip(
+            text=config.CTA_TEXT,
+            font_size=config.CTA_FONT_SIZE,
+            color=config.CTA_TEXT_COLOR,
+            bg_color=config.CTA_BACKGROUND_COLOR,
+            size=(width, None),  # Full width
+            method='caption'  # Auto-wrap text
+        )
+        _cta_text_cache[width] = txt_clip
+    return txt_clip
+
+
 def add_cta_overlay(clip: VideoFileClip) -> CompositeVideoClip:
     """
     Add CTA text overlay to the video.
-    
+
     Args:
         clip: Input video clip
-        
+
     Returns:
-        Video clip with CTA overlay
+        Video clip with CTA overlay, or the clip unchanged when
+        config.CTA_ENABLED is off (no composite is constructed at all)
     """
-    # Create text clip for CTA (MoviePy 2.x uses font_size instead of fontsize)
-    txt_clip = TextClip(
-        text=config.CTA_TEXT,
-        font_size=config.CTA_FONT_SIZE,
-        color=config.CTA_TEXT_COLOR,
-        bg_color=config.CTA_BACKGROUND_COLOR,
-        size=(clip.w, None),  # Full width
-        method='caption'  # Auto-wrap text
-    ).with_duration(clip.duration)  # MoviePy 2.x uses with_duration()
+    if not config.CTA_ENABLED:
+        return clip
+
+    # Reuse the rendered text bitmap; with_duration returns a cheap copy
+    txt_clip = _get_cta_text_clip(clip.w).with_duration(clip.duration)  # MoviePy 2.x uses with_duration()
     
     # Position at bottom (MoviePy 2.x uses with_position())
     if config.CTA_POSITION == "bottom":
@@ -203,8 +425,9 @@ def add_cta_overlay(clip: VideoFileClip) -> CompositeVideoClip:
     
     # Set opacity (MoviePy 2.x uses with_opacity())
     txt_clip = txt_clip.with_opacity(config.CTA_OPACITY)
-    
+
     # Composite text over video
+    from moviepy import CompositeVideoClip
     final_clip = CompositeVideoClip([clip, txt_clip])
     
     return final_clip
@@ -277,6 +500,255 @@ def calculate_instagram_bitrate(duration_seconds: float, target_size_mb: float =
     return f"{optimal_bitrate_kbps}k"
 
 
+def vertical_filter() -> str:
+    """
+    ffmpeg filter string matching convert_to_vertical's geometry.
+
+    scale-to-fit with centered black padding, done inside ffmpeg's
+    SIMD-optimized libswscale in one streaming pass - no frames ever
+    surface into Python.
+
+    The scale node sits FIRST in the chain: a 4K phone source drops to
+    1080-wide immediately after decode, so the pad, split and every
+    downstream encoder work on ~1/4 of the pixels. (MoviePy's .resized()
+    by contrast hands full-resolution frames through Python first.)
+    """
+    return (
+        f"scale={config.TARGET_WIDTH}:{config.TARGET_HEIGHT}:"
+        f"force_original_aspect_ratio=decrease,"
+        f"pad={config.TARGET_WIDTH}:{config.TARGET_HEIGHT}:"
+        f"(ow-iw)/2:(oh-ih)/2:color=black,setsar=1"
+    )
+
+
+def export_all_platforms_ffmpeg(input_path: Path, jobs: list, fps: float,
+                                audio_codec: str = None):
+    """
+    Encode one or more platform renditions in a single ffmpeg invocation.
+
+    The source is decoded exactly once: the landscape (YouTube) output
+    maps the decoded stream directly, and the vertical renditions share
+    one scale/pad filter chain whose result is split across their
+    encoders. Compared to per-platform write_videofile calls this drops
+    all repeat decode passes and keeps every frame inside ffmpeg.
+
+    Args:
+        input_path: Source video file
+        jobs: List of (platform, output_path, bitrate) tuples
+        fps: Output (normalized) frame rate
+        audio_codec: Source audio codec name from an earlier probe, if
+            the caller already ran one ('' for no audio stream); None
+            means probe here
+    """
+    if not jobs:
+        return
+
+    for platform, output_path, bitrate in jobs:
+        print(f"Exporting {platform} video to {output_path}... (bitrate {bitrate})")
+
+    codec = VIDEO_CODEC
+    if codec in _HW_PRESETS:
+        print(f"  Using hardware encoder: {codec}")
+    print(f"  Using source frame rate: {fps:.2f} fps (single ffmpeg pass, "
+          f"{len(jobs)} output(s))")
+
+    # Source audio is almost always AAC already: stream-copy it bit-exact
+    # instead of decode+resample+re-encode (audio was 10-20% of MoviePy's
+    # encode time). Non-AAC or unknown sources keep the re-encode.
+    if audio_codec is None:
+        audio_stream = next(
+            (s for s in probe(input_path).get('streams', [])
+             if s.get('codec_type') == 'audio'),
+            None
+        )
+        audio_codec = audio_stream.get('codec_name', '') if audio_stream else ''
+    if audio_codec == 'aac':
+        audio_args = ["-c:a", "copy"]
+        print("  Audio: AAC source, stream-copying (no re-encode)")
+    else:
+        audio_args = ["-c:a", "aac", "-b:a", "192k", "-ar", "44100"]
+
+    # All renditions encode concurrently inside the one ffmpeg process,
+    # so split the thread budget across them - otherwise each libx264
+    # instance spawns a full complement and 3 outputs oversubscribe an
+    # 8-core host ~3x. Hardware encoders ignore -threads.
+    per_output_threads = max(2, NUM_ENCODER_THREADS // len(jobs))
+
+    cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(input_path)]
+
+    # One vertical filter chain, split across however many vertical
+    # renditions need distinct encodes
+    vertical_count = sum(1 for platform, _, _ in jobs if platform != "youtube")
+    vert_labels = [f"vert{i}" for i in range(vertical_count)]
+    if vertical_count == 1:
+        cmd += ["-filter_complex", f"[0:v]{vertical_filter()}[vert0]"]
+    elif vertical_count > 1:
+        split = "".join(f"[{label}]" for label in vert_labels)
+        cmd += ["-filter_complex",
+                f"[0:v]{vertical_filter()},split={vertical_count}{split}"]
+
+    vert_index = 0
+    for platform, output_path, bitrate in jobs:
+        if platform == "youtube":
+            cmd += ["-map", "0:v"]
+            preset = _HW_PRESETS.get(codec) or config.X264_PRESET or "fast"
+        else:
+            cmd += ["-map", f"[{vert_labels[vert_index]}]"]
+            vert_index += 1
+            preset = _HW_PRESETS.get(codec) or config.X264_PRESET or "medium"
+
+        if platform == "youtube" and codec == "libx264":
+            # Constant quality for YouTube - no platform size cap, so CRF
+            # tracks content complexity instead of burning a fixed 10Mbps
+            # on mostly-static review footage
+            cmd += ["-c:v", codec, "-preset", preset,
+                    "-crf", str(config.YOUTUBE_CRF),
+                    "-maxrate", "15M", "-bufsize", "30M"]
+        else:
+            cmd += ["-c:v", codec, "-preset", preset, "-b:v", bitrate]
+        if codec == "libx264":
+            cmd += ["-b_strategy", "1"]
+            if platform != "youtube":
+                cmd += ["-rc-lookahead", "30", "-refs", "3", "-trellis", "1"]
+            if platform == "instagram":
+                # Cap the local rate so the size-limited rendition can't
+                # balloon past its estimate on complex scenes
+                kbps = int(bitrate[:-1])
+                cmd += ["-maxrate", f"{int(kbps * 1.5)}k", "-bufsize", f"{kbps * 2}k"]
+        elif codec in ("h264_nvenc", "hevc_nvenc"):
+            # NVENC-native rate control: VBR capped at the target bitrate
+            # keeps the size estimate honest on hardware encodes
+            cmd += ["-tune", "hq", "-rc", "vbr", "-maxrate", bitrate]
+        cmd += [
+            "-pix_fmt", "yuv420p",
+            "-profile:v", "high", "-level", "4.0",
+            "-g", str(int(fps)), "-bf", "2",
+            "-r", f"{fps}", "-vsync", "cfr",
+            "-movflags", "+faststart",
+            "-map", "0:a?", *audio_args,
+            "-threads", str(per_output_threads),
+            str(output_path),
+        ]
+
+    subprocess.run(cmd, check=True)
+
+    for platform, _, _ in jobs:
+        print(f"[OK] {platform} video exported successfully!")
+
+
+def two_pass_size_encode(input_path: Path, output_path: Path, bitrate: str,
+                         fps: float):
+    """
+    Two-pass libx264 encode of the vertical rendition at an exact average
+    bitrate.
+
+    Used when a size-capped output (Instagram, 100MB) overshoots: pass 1
+    measures complexity, pass 2 distributes the bit budget to hit the
+    average dead-on, so one retry is guaranteed to land under the cap
+    instead of iterating single-pass ABR guesses. Always uses libx264 -
+    NVENC has no 2-pass log mode, and the rare failure path values the
+    size guarantee over encode speed.
+
+    Args:
+        input_path: Source video file
+        output_path: Output file path (overwritten)
+        bitrate: Target average video bitrate, e.g. "2500k"
+        fps: Output (normalized) frame rate
+    """
+    import tempfile
+
+    kbps = int(bitrate[:-1])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        common = [
+            "-vf", vertical_filter(),
+            "-c:v", "libx264", "-preset", "medium",
+            "-b:v", bitrate,
+            "-maxrate", f"{int(kbps * 1.5)}k", "-bufsize", f"{kbps * 2}k",
+            "-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.0",
+            "-g", str(int(fps)), "-bf", "2",
+            "-r", f"{fps}", "-vsync", "cfr",
+            "-passlogfile", str(Path(tmpdir) / "x264pass"),
+            "-threads", str(NUM_ENCODER_THREADS),
+        ]
+        subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-i", str(input_path), *common,
+             "-pass", "1", "-an", "-f", "mp4", os.devnull],
+            check=True
+        )
+        # Pass 2 writes a sibling temp file, then swaps it in. Writing
+        # output_path directly would truncate the inode in place - and
+        # when the clone step hardlinked this rendition for another
+        # platform, that silently replaces the other platform's file
+        # too. os.replace only repoints this directory entry, so any
+        # other link keeps the original data.
+        tmp_output = output_path.with_name(output_path.stem + ".2pass.tmp.mp4")
+        try:
+            subprocess.run(
+                ["ffmpeg", "-y", "-v", "error", "-i", str(input_path), *common,
+                 "-pass", "2", "-movflags", "+faststart",
+                 "-c:a", "aac", "-b:a", "192k",
+                 str(tmp_output)],
+                check=True
+            )
+        except BaseException:
+            tmp_output.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_output, output_path)
+
+
+def get_platform_bitrate(platform: str, duration: float) -> str:
+    """
+    Video bitrate used for a platform's export.
+
+    Exposed separately from export_video so process_video can tell when two
+    platforms would produce an identical encode (same clip, same bitrate)
+    and reuse the file instead of encoding twice.
+
+    Args:
+        platform: Platform name ('youtube', 'instagram', 'tiktok')
+        duration: Video duration in seconds
+
+    Returns:
+        Bitrate string in format "XXXXk"
+    """
+    if platform == "instagram":
+        # Instagram: Dynamic bitrate to stay under 100MB limit
+        return calculate_instagram_bitrate(duration)
+    elif platform == "tiktok":
+        # TikTok allows up to 287MB, but we'll use similar optimization
+        return calculate_instagram_bitrate(duration, target_size_mb=200.0)
+    else:  # youtube
+        # YouTube allows much larger files, so we can use higher bitrate
+        return "10000k"  # 10 Mbps for landscape
+
+
+def clone_exported_video(source_path: Path, output_path: Path, platform: str):
+    """
+    Reuse an already-exported file for another platform.
+
+    Hardlinks when both paths are on the same filesystem (free), falling
+    back to a plain copy. Either way this is orders of magnitude cheaper
+    than re-running the identical encode.
+
+    Args:
+        source_path: Previously exported video with identical encode settings
+        output_path: Destination path for this platform
+        platform: Platform name (for logging)
+    """
+    print(f"Exporting {platform} video to {output_path}...")
+    print(f"  Identical encode already produced for this run - reusing {source_path.name}")
+    if output_path.exists():
+        output_path.unlink()
+    try:
+        os.link(source_path, output_path)
+        print(f"  Hardlinked (no data copied)")
+    except OSError:
+        shutil.copyfile(str(source_path), str(output_path))
+        print(f"  Copied file")
+    print(f"[OK] {platform} video exported successfully!")
+
+
 def export_video(clip: CompositeVideoClip, output_path: Path, platform: str):
     """
     Export video to specified path with optimized settings.
@@ -289,54 +761,42 @@ def export_video(clip: CompositeVideoClip, output_path: Path, platform: str):
     print(f"Exporting {platform} video to {output_path}...")
     
     # Platform-specific encoding settings
+    duration = clip.duration
+    bitrate = get_platform_bitrate(platform, duration)
+    audio_bitrate = "192k"
     if platform == "instagram":
-        # Instagram: Dynamic bitrate to stay under 100MB limit
-        # Calculate optimal bitrate based on video duration
-        duration = clip.duration
-        bitrate = calculate_instagram_bitrate(duration)
         estimated_size_mb = (float(bitrate[:-1]) / 1000 + 0.192) * duration / 8
         print(f"  Video duration: {duration:.1f}s")
         print(f"  Calculated bitrate: {bitrate} (estimated size: {estimated_size_mb:.1f}MB)")
-        audio_bitrate = "192k"
         preset = "medium"  # Better quality encoding (slightly slower but smoother)
     elif platform == "tiktok":
-        # TikTok: Similar to Instagram, but TikTok allows larger files
-        # Still optimize to keep reasonable file sizes
-        duration = clip.duration
-        # TikTok allows up to 287MB, but we'll use similar optimization
-        bitrate = calculate_instagram_bitrate(duration, target_size_mb=200.0)  # More lenient
-        audio_bitrate = "192k"
         preset = "medium"  # Better quality encoding
     else:  # youtube
         # YouTube: Can use faster preset since it's landscape (less processing)
-        # YouTube allows much larger files, so we can use higher bitrate
-        bitrate = "10000k"  # 10 Mbps for landscape
-        audio_bitrate = "192k"
         preset = "fast"
     
-    # Use more threads for faster encoding (auto-detect or use more)
-    import multiprocessing
-    num_threads = min(multiprocessing.cpu_count(), 8)  # Use up to 8 threads
-    
-    # Build FFmpeg parameters
-    ffmpeg_params = [
-        '-movflags', '+faststart',  # Enable fast start for web playback
-        '-pix_fmt', 'yuv420p',  # Ensure compatibility
-        '-profile:v', 'high',  # Use high profile for better quality
-        '-level', '4.0',  # H.264 level 4.0 for compatibility
-        '-g', '30',  # Keyframe interval (1 keyframe per second at 30fps)
-        '-bf', '2',  # B-frames for better compression
-        '-b_strategy', '1',  # Adaptive B-frame placement
-    ]
-    
-    # Add Instagram and TikTok-specific optimizations for smoother playback
-    if platform in ["instagram", "tiktok"]:
-        ffmpeg_params.extend([
-            '-rc-lookahead', '30',  # Lookahead for better quality
-            '-refs', '3',  # Reference frames for better quality
-            '-trellis', '1',  # Trellis quantization for better quality
-        ])
-    
+    # Hardware encoders (detected once at import) use their own presets and
+    # don't understand the x264 tuning flags below
+    codec = VIDEO_CODEC
+    if codec in _HW_PRESETS:
+        print(f"  Using hardware encoder: {codec}")
+        preset = _HW_PRESETS[codec]
+    elif codec == 'libx264' and config.X264_PRESET:
+        preset = config.X264_PRESET  # Speed/size knob from .env
+
+    # Build FFmpeg parameters from the precomputed common groups
+    ffmpeg_params = list(_FFMPEG_PARAMS_BASE)
+
+    if codec == 'libx264':
+        ffmpeg_params.extend(('-b_strategy', '1'))  # Adaptive B-frame placement (x264 only)
+        if platform in ("instagram", "tiktok"):
+            # Extra quality flags for the vertical renditions
+            ffmpeg_params.extend(_FFMPEG_PARAMS_MOBILE)
+
+    if codec in ('h264_nvenc', 'hevc_nvenc'):
+        # NVENC-native rate control: VBR capped at the target bitrate
+        ffmpeg_params.extend(['-tune', 'hq', '-rc', 'vbr', '-maxrate', bitrate])
+
     # Use the clip's actual FPS instead of forcing 30fps
     # This preserves the original frame rate and prevents sync issues
     output_fps = clip.fps
@@ -345,29 +805,28 @@ def export_video(clip: CompositeVideoClip, output_path: Path, platform: str):
         print(f"  Warning: Invalid FPS, using 30fps as fallback")
     else:
         print(f"  Using source frame rate: {output_fps:.2f} fps")
-    
-    # Update keyframe interval to match frame rate (1 keyframe per second)
-    # Remove the old '-g' parameter and add a new one based on actual FPS
-    ffmpeg_params = [p for p in ffmpeg_params if p != '-g']
-    keyframe_interval = int(output_fps)  # 1 keyframe per second
-    ffmpeg_params.append('-g')
-    ffmpeg_params.append(str(keyframe_interval))
-    
-    # Add audio sync parameters to prevent drift
-    ffmpeg_params.extend([
-        '-async', '1',  # Audio sync method
-        '-vsync', 'cfr',  # Constant frame rate (ensures sync)
-    ])
-    
+
+    # fps-dependent and audio-sync args: keyframe every second at the
+    # actual frame rate, ffmpeg-level drift correction, CFR output
+    ffmpeg_params.extend(('-g', str(int(output_fps)), '-async', '1', '-vsync', 'cfr'))
+
+    if platform == "youtube" and codec == "libx264":
+        # Constant quality for YouTube (no size cap) - drop the fixed
+        # bitrate and let CRF track content complexity instead
+        ffmpeg_params.extend(('-crf', str(config.YOUTUBE_CRF),
+                              '-maxrate', '15M', '-bufsize', '30M'))
+        bitrate = None
+
+
     clip.write_videofile(
         str(output_path),
-        codec='libx264',
+        codec=codec,
         audio_codec='aac',
         fps=output_fps,  # Use actual FPS instead of forcing 30
         preset=preset,
         bitrate=bitrate,
         audio_bitrate=audio_bitrate,
-        threads=num_threads,
+        threads=NUM_ENCODER_THREADS,
         ffmpeg_params=ffmpeg_params,
         audio_nbytes=4,  # 32-bit audio for better quality
         audio_fps=44100  # Standard audio sample rate
@@ -384,38 +843,28 @@ def export_video(clip: CompositeVideoClip, output_path: Path, platform: str):
             
             # Calculate new bitrate to get under 100MB
             # Use 90MB as target to leave margin
-            new_bitrate = calculate_instagram_bitrate(clip.duration, target_size_mb=90.0)
+            new_bitrate = calculate_instagram_bitrate(duration, target_size_mb=90.0)
             print(f"  New bitrate: {new_bitrate}")
             
             # Re-encode with lower bitrate (use same optimized settings)
             # Use the same FPS and sync settings as the original encode
             reencode_fps = clip.fps if clip.fps and clip.fps > 0 else 30
-            keyframe_interval = int(reencode_fps)
-            
-            ffmpeg_params = [
-                '-movflags', '+faststart',
-                '-pix_fmt', 'yuv420p',
-                '-profile:v', 'high',
-                '-level', '4.0',
-                '-g', str(keyframe_interval),
-                '-bf', '2',
-                '-b_strategy', '1',
-                '-rc-lookahead', '30',
-                '-refs', '3',
-                '-trellis', '1',
-                '-async', '1',  # Audio sync
-                '-vsync', 'cfr',  # Constant frame rate
-            ]
-            
+
+            ffmpeg_params = list(_FFMPEG_PARAMS_BASE)
+            if codec == 'libx264':
+                ffmpeg_params.extend(('-b_strategy', '1'))
+                ffmpeg_params.extend(_FFMPEG_PARAMS_MOBILE)
+            ffmpeg_params.extend(('-g', str(int(reencode_fps)), '-async', '1', '-vsync', 'cfr'))
+
             clip.write_videofile(
                 str(output_path),
-                codec='libx264',
+                codec=codec,
                 audio_codec='aac',
                 fps=reencode_fps,  # Use actual FPS
                 preset=preset,
                 bitrate=new_bitrate,
                 audio_bitrate=audio_bitrate,
-                threads=num_threads,
+                threads=NUM_ENCODER_THREADS,
                 ffmpeg_params=ffmpeg_params,
                 audio_nbytes=4,
                 audio_fps=44100,
@@ -437,6 +886,36 @@ def export_video(clip: CompositeVideoClip, output_path: Path, platform: str):
     print(f"[OK] {platform} video exported successfully!")
 
 
+# Filename-encoded Amazon URLs use '-' in place of '.', '/' and ':'.
+# One precompiled alternation restores them in a single left-to-right
+# scan instead of a chain of str.replace() calls that each re-scan and
+# re-allocate the whole string. Path tokens come before domain tokens so
+# '-dp-' can't be half-eaten by '-de'.
+_AMAZON_LINK_SUBS = {
+    '-gp-product-': '/gp/product/',
+    '-dp-': '/dp/',
+    'amzn-to-': 'amzn.to/',
+    '-co-uk': '.co.uk',
+    '-com': '.com',
+    '-ca': '.ca',
+    '-de': '.de',
+}
+_AMAZON_LINK_RE = re.compile('|'.join(map(re.escape, _AMAZON_LINK_SUBS)))
+
+
+@lru_cache(maxsize=8)
+def _load_links_map(path: str, mtime: float) -> dict:
+    """
+    Parse a video_links.json, cached on (path, mtime).
+
+    A batch of videos in one input folder shares the same mapping file;
+    keying on mtime means each worker parses it once per run but still
+    picks up edits made between runs.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def extract_amazon_link(video_path: Path) -> str:
     """
     Extract Amazon product link from video filename or associated files.
@@ -461,35 +940,24 @@ def extract_amazon_link(video_path: Path) -> str:
         # Extract the link part after the first underscore
         parts = video_name.split('_', 1)
         if len(parts) > 1:
-            link_part = parts[1]
-            amazon_link = link_part
-            
+            amazon_link = parts[1]
+
             # Replace protocol pattern: https- -> https://
             if amazon_link.startswith('https-'):
-                amazon_link = amazon_link.replace('https-', 'https://', 1)
+                amazon_link = 'https://' + amazon_link[len('https-'):]
             elif amazon_link.startswith('http-'):
-                amazon_link = amazon_link.replace('http-', 'http://', 1)
-            
-            # Handle shortened Amazon links (amzn.to)
-            # Pattern: https://amzn-to-3K7euOO -> https://amzn.to/3K7euOO
-            if 'amzn-to-' in amazon_link:
-                # Replace amzn-to- with amzn.to/
-                amazon_link = amazon_link.replace('amzn-to-', 'amzn.to/')
-            elif amazon_link.startswith('https://amzn-to') or amazon_link.startswith('http://amzn-to'):
-                # Handle case where it's just amzn-to without the dash after
+                amazon_link = 'http://' + amazon_link[len('http-'):]
+
+            # Restore shortened links (amzn-to- -> amzn.to/), domains
+            # (amazon-com -> amazon.com) and path separators
+            # (dp-12345 -> dp/12345) in one pass
+            amazon_link = _AMAZON_LINK_RE.sub(
+                lambda m: _AMAZON_LINK_SUBS[m.group()], amazon_link)
+
+            # Legacy form: bare amzn-to with no dash after it
+            if amazon_link.startswith(('https://amzn-to', 'http://amzn-to')):
                 amazon_link = amazon_link.replace('amzn-to', 'amzn.to', 1)
-            
-            # Handle full Amazon URLs
-            # Replace domain pattern: amazon-com -> amazon.com
-            amazon_link = amazon_link.replace('-com', '.com')
-            amazon_link = amazon_link.replace('-co-uk', '.co.uk')
-            amazon_link = amazon_link.replace('-ca', '.ca')
-            amazon_link = amazon_link.replace('-de', '.de')
-            
-            # Replace path separators: dp-12345 -> dp/12345
-            amazon_link = amazon_link.replace('-dp-', '/dp/')
-            amazon_link = amazon_link.replace('-gp-product-', '/gp/product/')
-            
+
             # Replace remaining hyphens with slashes for path segments
             # But be careful - only replace hyphens that are part of the path, not in the domain
             # Pattern: https://amzn.to/3K7euOO (already handled above)
@@ -503,51 +971,71 @@ def extract_amazon_link(video_path: Path) -> str:
             if ('amazon' in amazon_link.lower() or 'amzn.to' in amazon_link.lower()) and ('http://' in amazon_link or 'https://' in amazon_link):
                 return amazon_link
     
+    # One directory listing replaces a stat syscall per candidate sidecar
+    # (4+ exists() checks per video, which adds up on network filesystems)
+    try:
+        dir_names = {entry.name for entry in os.scandir(video_dir)}
+    except OSError:
+        dir_names = set()
+
     # Method 2: Check for sidecar files (.amazon or .link)
-    for ext in ['.amazon', '.link', '.txt']:
-        sidecar_file = video_dir / f"{video_name}{ext}"
-        if sidecar_file.exists():
+    for ext in ('.amazon', '.link', '.txt'):
+        sidecar_name = f"{video_name}{ext}"
+        if sidecar_name in dir_names:
             try:
-                with open(sidecar_file, 'r', encoding='utf-8') as f:
+                with open(video_dir / sidecar_name, 'r', encoding='utf-8') as f:
                     link = f.read().strip()
                     if link and 'amazon' in link.lower():
                         return link
             except Exception:
                 pass
-    
+
     # Method 3: Check JSON mapping file
-    json_file = video_dir / "video_links.json"
-    if json_file.exists():
+    if "video_links.json" in dir_names:
+        json_file = video_dir / "video_links.json"
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                links_map = json.load(f)
-                # Try exact match first
-                if video_name in links_map:
-                    return links_map[video_name]
-                # Try with extension
-                if video_path.name in links_map:
-                    return links_map[video_path.name]
+            links_map = _load_links_map(str(json_file), json_file.stat().st_mtime)
+            # Try exact match first
+            if video_name in links_map:
+                return links_map[video_name]
+            # Try with extension
+            if video_path.name in links_map:
+                return links_map[video_path.name]
         except Exception:
             pass
-    
+
     # No link found
     return ""
 
 
-def generate_metadata(video_name: str, platform: str, amazon_link: str = "") -> dict:
+# Maps filename separators to spaces in one pass (vs chained .replace)
+_TITLE_SEPARATORS = str.maketrans('_-', '  ')
+
+
+def video_title(video_name: str) -> str:
+    """Derive a display title from the video filename stem."""
+    return video_name.translate(_TITLE_SEPARATORS).title()
+
+
+def generate_metadata(video_name: str, platform: str, amazon_link: str = "",
+                      title: str = None) -> dict:
     """
     Generate metadata for a platform.
-    
+
     Args:
         video_name: Name of the video (without extension)
         platform: Platform name ('youtube', 'instagram', 'tiktok')
-        
+        amazon_link: Amazon product link, if one was found
+        title: Precomputed title (callers processing several platforms
+            pass it once instead of rederiving it per platform)
+
     Returns:
         Dictionary with metadata
     """
     # Generate title from video name
-    title = video_name.replace('_', ' ').replace('-', ' ').title()
-    
+    if title is None:
+        title = video_title(video_name)
+
     # Get platform-specific hashtags
     hashtags = config.DEFAULT_HASHTAGS.get(platform, [])
     
@@ -588,61 +1076,88 @@ def save_metadata(metadata: dict, output_path: Path, platform: str):
     """
     # Create metadata file path (same name as video, but .json)
     metadata_path = output_path.with_suffix('.json')
-    
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
-    
+
+    if orjson is not None:
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(metadata_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+
     print(f"[OK] {platform} metadata saved to {metadata_path}")
 
 
-def upload_videos(uploaded_videos: dict, video_name: str) -> dict:
+# Uploader instances shared across a batch. Construction typically does
+# OAuth token refresh and TLS/session setup - seconds of latency that
+# shouldn't repeat per video; reuse also keeps HTTP keep-alive pools warm.
+_uploader_cache = {}
+
+# One lock per platform: the cached uploaders are not safe for
+# concurrent use (Instagram's last_s3_key/storage_type bookkeeping,
+# googleapiclient service objects), and a shared batch pool can land two
+# videos' uploads for the same platform at once. Same-platform uploads
+# queue here; different platforms still run in parallel.
+_uploader_locks = {platform: threading.Lock()
+                   for platform in _UPLOADER_CLASS_NAMES}
+
+
+def _get_uploader(platform: str):
     """
-    Upload videos to social media platforms.
-    
+    Return the shared uploader for a platform, constructing it on first use.
+
     Args:
-        uploaded_videos: Dictionary with platform -> {path, metadata}
+        platform: Platform name ('youtube', 'instagram', 'tiktok')
+
+    Returns:
+        Uploader instance, or None for unknown platforms
+    """
+    if platform not in _uploader_cache:
+        class_name = _UPLOADER_CLASS_NAMES.get(platform)
+        if class_name is None:
+            _uploader_cache[platform] = None
+        else:
+            import uploaders
+            # Attribute access imports just this platform's submodule
+            _uploader_cache[platform] = getattr(uploaders, class_name)()
+    return _uploader_cache[platform]
+
+
+def upload_video_for_platform(platform: str, video_path: Path, metadata: dict,
+                              video_name: str):
+    """
+    Upload one exported video to its platform.
+
+    Args:
+        platform: Platform name ('youtube', 'instagram', 'tiktok')
+        video_path: Path to the exported video file
+        metadata: Platform metadata (title/caption/hashtags)
         video_name: Name of the video
-        
+
     Returns:
-        Dictionary with upload results per platform
+        Uploader result, or None if no uploader exists or upload failed
     """
-    results = {}
-    
-    # Initialize uploaders
-    uploaders = {
-        'youtube': YouTubeUploader() if 'youtube' in config.UPLOAD_PLATFORMS else None,
-        'instagram': InstagramUploader() if 'instagram' in config.UPLOAD_PLATFORMS else None,
-        'tiktok': TikTokUploader() if 'tiktok' in config.UPLOAD_PLATFORMS else None,
-    }
-    
-    for platform in config.UPLOAD_PLATFORMS:
-        if platform not in uploaded_videos:
-            continue
-        
-        uploader = uploaders.get(platform)
+    lock = _uploader_locks.get(platform)
+    if lock is None:
+        return None  # Unknown platform - no uploader class
+
+    # Extract title and description from metadata
+    if platform == 'youtube':
+        title = metadata.get('title', video_name)
+        description = metadata.get('description', '')
+    else:  # instagram / tiktok don't use titles
+        title = video_name
+        description = metadata.get('caption', '')
+    tags = metadata.get('hashtags', [])
+
+    # Serialized per platform (see _uploader_locks): construction and
+    # upload both touch shared uploader state
+    with lock:
+        uploader = _get_uploader(platform)
         if not uploader:
-            continue
-        
+            return None
+
         print(f"\nUploading to {platform.upper()}...")
-        
-        video_info = uploaded_videos[platform]
-        video_path = video_info['path']
-        metadata = video_info['metadata']
-        
-        # Extract title and description from metadata
-        if platform == 'youtube':
-            title = metadata.get('title', video_name)
-            description = metadata.get('description', '')
-            tags = metadata.get('hashtags', [])
-        elif platform == 'instagram':
-            title = video_name  # Instagram doesn't use titles
-            description = metadata.get('caption', '')
-            tags = metadata.get('hashtags', [])
-        else:  # tiktok
-            title = video_name
-            description = metadata.get('caption', '')
-            tags = metadata.get('hashtags', [])
-        
+
         # Upload video
         result = uploader.upload_video(
             video_path=video_path,
@@ -651,66 +1166,165 @@ def upload_videos(uploaded_videos: dict, video_name: str) -> dict:
             tags=tags,
             privacy_status=config.UPLOAD_PRIVACY_STATUS
         )
-        
-        results[platform] = result
-        
-        if result:
-            print(f"  [OK] {platform.upper()} upload successful!")
-        else:
-            print(f"  [FAILED] {platform.upper()} upload failed")
-    
-    return results
+
+    if result:
+        print(f"  [OK] {platform.upper()} upload successful!")
+    else:
+        print(f"  [FAILED] {platform.upper()} upload failed")
+
+    return result
+
+
+def upload_and_record(platform: str, video_path: Path, metadata: dict,
+                      video_name: str):
+    """
+    Upload one rendition and fold the result back into its metadata file.
+
+    Self-contained so it can run detached on a shared upload pool: a
+    batch run doesn't have to block on video j's uploads before encoding
+    video j+1 - whenever the upload lands, this writes the result.
+
+    Args:
+        platform: Platform name ('youtube', 'instagram', 'tiktok')
+        video_path: Path to the exported video file
+        metadata: Platform metadata (mutated with the upload result)
+        video_name: Name of the video
+
+    Returns:
+        Uploader result, or None if the upload failed or raised
+    """
+    try:
+        result = upload_video_for_platform(platform, video_path, metadata, video_name)
+    except Exception as e:
+        print(f"  [FAILED] {platform.upper()} upload raised: {e}")
+        return None
+
+    if result:
+        metadata['upload'] = result
+        save_metadata(metadata, video_path, platform)
+    return result
 
 
-def log_processing(video_name: str, status: str, error: str = None):
+def _flush_upload_cleanup():
+    """
+    Run deferred end-of-run cleanup on the cached uploaders.
+
+    Instagram queues its temporary S3 keys during the run; flushing once
+    here deletes them in a single bulk request instead of one round-trip
+    per video. Called after every upload in the run has finished.
+    """
+    uploader = _uploader_cache.get('instagram')
+    flush = getattr(uploader, 'flush_s3_cleanup', None)
+    if flush is None:
+        return
+    try:
+        flush()
+    except Exception as e:
+        print(f"  Warning: Deferred S3 cleanup failed: {e}")
+# Processing-log handler, opened lazily and kept open for the life of the
+# process instead of an open/write/close cycle per entry. Rebuilt when the
+# date rolls over so the date-based log split is preserved.
+_log_state = {"date": None, "logger": None}
+
+
+def _get_processing_logger(now: datetime) -> logging.Logger:
+    """Return the shared processing logger for the given date."""
+    date_str = now.strftime('%Y-%m-%d')
+    if _log_state["date"] != date_str:
+        logger = logging.getLogger("processing")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False  # Keep entries out of the root logger
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        log_file = config.ensure_dir(config.LOGS_FOLDER) / f"processing_{date_str}.log"
+        # Append mode + one write() per record: batch workers each hold
+        # their own handler on the same file, and O_APPEND keeps whole
+        # lines from interleaving without a cross-process queue
+        handler = logging.FileHandler(log_file, encoding="utf-8")
+        logger.addHandler(handler)
+        _log_state["date"] = date_str
+        _log_state["logger"] = logger
+    return _log_state["logger"]
+
+
+def log_processing(video_name: str, status: str, error: str = None,
+                   now: datetime = None):
     """
     Log processing status to a log file.
-    
+
     Args:
         video_name: Name of the video file
         status: 'success' or 'failed'
         error: Error message if status is 'failed'
+        now: Timestamp to log under (process_video passes its single
+            per-video timestamp so filename and entry always agree)
     """
-    log_file = config.LOGS_FOLDER / f"processing_{datetime.now().strftime('%Y-%m-%d')}.log"
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if now is None:
+        now = datetime.now()
+
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
     log_entry = f"[{timestamp}] {video_name}: {status}"
     if error:
         log_entry += f" - {error}"
-    log_entry += "\n"
-    
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(log_entry)
 
+    _get_processing_logger(now).info(log_entry)
 
-def archive_video(input_path: Path):
+
+def archive_video(input_path: Path, now: datetime = None):
     """
     Move processed video to archive folder.
-    
+
     Args:
         input_path: Path to the processed video file
+        now: Timestamp used for collision-renames (defaults to current time)
     """
     try:
-        archive_path = config.ARCHIVE_FOLDER / input_path.name
+        if now is None:
+            now = datetime.now()
+        archive_folder = config.ensure_dir(config.ARCHIVE_FOLDER)
+        archive_path = archive_folder / input_path.name
         # If file already exists in archive, add timestamp
         if archive_path.exists():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            archive_path = config.ARCHIVE_FOLDER / f"{input_path.stem}_{timestamp}{input_path.suffix}"
-        
-        shutil.move(str(input_path), str(archive_path))
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            archive_path = archive_folder / f"{input_path.stem}_{timestamp}{input_path.suffix}"
+
+        # Same filesystem (the common case): one atomic rename syscall,
+        # no video bytes copied and no half-copy left on a crash. Only a
+        # cross-device error falls back to shutil.move's copy+delete.
+        try:
+            os.replace(input_path, archive_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(input_path), str(archive_path))
         print(f"  Archived to: {archive_path.name}")
     except Exception as e:
         print(f"  Warning: Could not archive video: {e}")
 
 
-def process_video(input_path: Path, archive: bool = True) -> bool:
+def _close_clip(clip):
+    """Close a clip, swallowing errors (cleanup must not mask outcomes)."""
+    try:
+        clip.close()
+    except Exception:
+        pass
+
+
+def process_video(input_path: Path, archive: bool = True,
+                  upload_pool=None) -> bool:
     """
     Main processing pipeline.
-    
+
     Args:
         input_path: Path to input video file
         archive: Whether to archive the video after successful processing
-        
+        upload_pool: Optional shared ThreadPoolExecutor for uploads. When
+            given (serial batch runs), uploads are submitted detached and
+            keep running while the caller encodes the next video; the
+            caller owns the pool's shutdown/wait. When None, this
+            function runs its own pool and waits before returning.
+
     Returns:
         True if processing succeeded, False otherwise
     """
@@ -718,43 +1332,118 @@ def process_video(input_path: Path, archive: bool = True) -> bool:
     clip = None
     instagram_clip = None
     tiktok_clip = None
-    final_clip = None
-    
+    upload_enabled = False
+    upload_executor = None
+    upload_futures = {}
+    owns_upload_pool = True
+
+    # Every clip registers its close() here the moment it's created, so
+    # decoder processes and their FDs are released on success and failure
+    # alike - no per-path cleanup blocks, no orphaned ffmpeg children
+    # accumulating across a batch
+    clip_stack = ExitStack()
+
+    # One timestamp for the whole video: date folder, log file, log entry
+    # and archive renames all agree even across a midnight boundary
+    started_at = datetime.now()
+
     try:
-        print(f"\n{'='*60}")
-        print(f"Processing: {input_path.name}")
-        print(f"{'='*60}\n")
-        
+        # Banners go out as one write: print takes the stdout lock per
+        # call, which serializes parallel batch workers needlessly
+        print(f"\n{'='*60}\nProcessing: {input_path.name}\n{'='*60}\n")
+
         # Step 1: Load video
         print("Step 1: Loading video...")
-        clip = VideoFileClip(str(input_path))
-        print(f"  Original: {clip.w}x{clip.h}, {clip.duration:.2f}s, {clip.fps}fps")
-        
-        # Step 2: Normalize
-        print("\nStep 2: Normalizing video...")
-        clip = normalize_video(clip)
-        
+
+        # Cheap ffprobe pass first: rejects corrupt/audio-only files and
+        # supplies fps/duration without paying for MoviePy's decoder init
+        source_fps = None
+        source_duration = None
+        source_audio_codec = None
+        info = probe(input_path)
+        if info:
+            audio_stream = next(
+                (s for s in info.get('streams', []) if s.get('codec_type') == 'audio'),
+                None
+            )
+            source_audio_codec = audio_stream.get('codec_name', '') if audio_stream else ''
+            video_stream = next(
+                (s for s in info.get('streams', []) if s.get('codec_type') == 'video'),
+                None
+            )
+            if video_stream is None:
+                raise ValueError(f"No video stream found in {input_path.name}")
+            source_duration = float(info.get('format', {}).get('duration', 0) or 0)
+            try:
+                num, den = video_stream.get('r_frame_rate', '').split('/')
+                source_fps = float(num) / float(den)
+            except (ValueError, ZeroDivisionError):
+                source_fps = None
+            print(f"  Probed: {video_stream.get('width')}x{video_stream.get('height')}, "
+                  f"{source_duration:.2f}s")
+
+        # A MoviePy reader is only needed when the CTA overlay forces the
+        # composite path (or when ffprobe couldn't supply fps/duration) -
+        # the ffmpeg fan-out decodes the source itself, so opening a clip
+        # would just add a redundant decoder pass
+        if config.CTA_ENABLED or not source_fps or not source_duration:
+            from moviepy import VideoFileClip
+            clip = VideoFileClip(str(input_path))
+            clip_stack.callback(_close_clip, clip)
+            print(f"  Original: {clip.w}x{clip.h}, {clip.duration:.2f}s, {clip.fps}fps")
+
+            # Step 2: Normalize
+            print("\nStep 2: Normalizing video...")
+            clip = normalize_video(clip)
+            source_fps = clip.fps
+            source_duration = clip.duration
+        else:
+            # Step 2: Normalize (ffmpeg enforces CFR at this rate via -r)
+            print("\nStep 2: Normalizing video...")
+            print(f"  Original FPS: {source_fps:.2f}")
+            source_fps = choose_normalized_fps(source_fps)
+            print(f"  [OK] Output frame rate: {source_fps:.2f} fps (CFR enforced at encode)")
+
         # Step 3: Prepare clips for different platforms
         print("\nStep 3: Preparing clips for platforms...")
-        
+
         # YouTube: Keep original landscape format (full length, no duration limit)
         youtube_clip = clip
-        print(f"  YouTube: {youtube_clip.w}x{youtube_clip.h}, {youtube_clip.duration:.2f}s (original format, full length)")
-        
-        # Instagram: Full length, convert to vertical format
-        print("\nStep 4: Preparing Instagram clip...")
-        print("  Converting to vertical format (1080x1920) - full length...")
-        instagram_clip = convert_to_vertical(clip)
-        print(f"  Instagram: {instagram_clip.w}x{instagram_clip.h}, {instagram_clip.duration:.2f}s (vertical, full length)")
-        
-        # TikTok: Full length, convert to vertical format
-        print("\nStep 5: Preparing TikTok clip...")
-        print("  Converting to vertical format (1080x1920) - full length...")
-        tiktok_clip = convert_to_vertical(clip)
-        print(f"  TikTok: {tiktok_clip.w}x{tiktok_clip.h}, {tiktok_clip.duration:.2f}s (vertical, full length)")
+        if clip is not None:
+            print(f"  YouTube: {youtube_clip.w}x{youtube_clip.h}, {youtube_clip.duration:.2f}s (original format, full length)")
+        else:
+            print(f"  YouTube: original landscape format, {source_duration:.2f}s (encoded directly by ffmpeg)")
         
-        # Step 6: Add CTA overlay (disabled - no overlay on videos)
-        print("\nStep 6: Skipping CTA overlay...")
+        # Instagram/TikTok: full length, vertical 9:16. With the CTA
+        # overlay off (the default) the conversion runs inside ffmpeg at
+        # export time - no MoviePy composite, no per-frame numpy roundtrip.
+        # The composite path only exists to burn the overlay in.
+        if config.CTA_ENABLED:
+            print("\nStep 4: Preparing Instagram clip...")
+            print("  Converting to vertical format (1080x1920) - full length...")
+            instagram_clip = convert_to_vertical(clip)
+            clip_stack.callback(_close_clip, instagram_clip)
+            print(f"  Instagram: {instagram_clip.w}x{instagram_clip.h}, {instagram_clip.duration:.2f}s (vertical, full length)")
+
+            # TikTok: same vertical conversion as Instagram - reuse the
+            # clip instead of building the composite a second time
+            print("\nStep 5: Preparing TikTok clip...")
+            print("  Reusing Instagram vertical conversion (identical transform)...")
+            tiktok_clip = instagram_clip
+            print(f"  TikTok: {tiktok_clip.w}x{tiktok_clip.h}, {tiktok_clip.duration:.2f}s (vertical, full length)")
+
+            # Step 6: Add CTA overlay on the vertical clips (the composite
+            # alpha-blends text into every frame of the encode)
+            print("\nStep 6: Adding CTA overlay...")
+            instagram_clip = add_cta_overlay(instagram_clip)
+            clip_stack.callback(_close_clip, instagram_clip)  # The composite is a new clip
+            tiktok_clip = instagram_clip  # Keep sharing the same clip
+        else:
+            print("\nStep 4: Preparing Instagram clip...")
+            print("  Vertical conversion (1080x1920) deferred to ffmpeg at export...")
+            print("\nStep 5: Preparing TikTok clip...")
+            print("  Vertical conversion (1080x1920) deferred to ffmpeg at export...")
+            print("\nStep 6: Skipping CTA overlay (CTA_ENABLED=false - fast ffmpeg path)...")
         
         # Step 7: Extract Amazon link (once, before processing platforms)
         print("\nStep 7: Extracting Amazon product link...")
@@ -766,36 +1455,95 @@ def process_video(input_path: Path, archive: bool = True) -> bool:
         
         # Step 8: Export for each platform (using date-based folders)
         print("\nStep 8: Exporting videos...")
-        date_folder = datetime.now().strftime("%Y-%m-%d")
+        date_folder = started_at.strftime("%Y-%m-%d")
+        title = video_title(video_name)  # Same for every platform
         
         uploaded_videos = {}  # Store upload results
-        
+
         # Only process platforms that are enabled in UPLOAD_PLATFORMS
         # If upload is disabled, process all platforms (for manual review)
         platforms_to_process = config.UPLOAD_PLATFORMS if config.AUTO_UPLOAD_ENABLED else ["youtube", "instagram", "tiktok"]
-        
+
+        # Uploads run on a small thread pool, submitted as soon as each
+        # platform's export lands so network time overlaps the remaining
+        # encodes instead of being paid serially after them. A shared
+        # pool from process_batch additionally lets them overlap the
+        # NEXT video's encode; we only wait on pools we own.
+        owns_upload_pool = upload_pool is None
+        upload_enabled = config.AUTO_UPLOAD_ENABLED and _uploaders_available()
+        if upload_enabled and owns_upload_pool:
+            from concurrent.futures import ThreadPoolExecutor
+            upload_executor = ThreadPoolExecutor(
+                max_workers=len(platforms_to_process),
+                thread_name_prefix="upload"
+            )
+        elif upload_enabled:
+            upload_executor = upload_pool
+
         print(f"\nProcessing videos for platforms: {', '.join(platforms_to_process)}")
-        
+
+        # Encode-once, write-many: platforms that share geometry AND a
+        # computed bitrate (e.g. Instagram/TikTok on short videos where both
+        # clamp to the max bitrate) reuse the first export instead of
+        # re-encoding
+        exported_encodes = {}  # (geometry/clip, bitrate) -> output path
+
+        output_paths = {
+            platform: config.get_output_folder(platform, date_folder) / f"{video_name}.mp4"
+            for platform in platforms_to_process
+        }
+
+        if not config.CTA_ENABLED:
+            # Fan-out: every rendition comes out of one ffmpeg invocation
+            # that decodes the source a single time
+            jobs = []
+            clones = []
+            for platform in platforms_to_process:
+                kind = "landscape" if platform == "youtube" else "vertical"
+                encode_key = (kind, get_platform_bitrate(platform, source_duration))
+                if encode_key in exported_encodes:
+                    clones.append((exported_encodes[encode_key], output_paths[platform], platform))
+                else:
+                    jobs.append((platform, output_paths[platform], encode_key[1]))
+                    exported_encodes[encode_key] = output_paths[platform]
+
+            export_all_platforms_ffmpeg(input_path, jobs, source_fps,
+                                        audio_codec=source_audio_codec)
+            for source_path, clone_path, platform in clones:
+                clone_exported_video(source_path, clone_path, platform)
+
+            # Instagram's 100MB cap is checked after the joint encode; an
+            # overshoot re-encodes only that rendition at a lower bitrate
+            if "instagram" in output_paths:
+                ig_path = output_paths["instagram"]
+                file_size_mb = ig_path.stat().st_size / (1024 * 1024)
+                print(f"  Instagram file size: {file_size_mb:.1f}MB")
+                if file_size_mb > 100:
+                    new_bitrate = calculate_instagram_bitrate(source_duration, target_size_mb=90.0)
+                    print(f"  [WARNING] Exceeds 100MB limit - 2-pass re-encode at {new_bitrate}")
+                    two_pass_size_encode(input_path, ig_path, new_bitrate, source_fps)
+
         for platform in platforms_to_process:
-            output_folder = config.get_output_folder(platform, date_folder)
-            output_path = output_folder / f"{video_name}.mp4"
-            
-            # Choose the appropriate clip for each platform
-            if platform == "youtube":
-                # YouTube: Use original landscape format (full length)
-                platform_clip = youtube_clip
-            elif platform == "instagram":
-                # Instagram: Use full-length vertical format
-                platform_clip = instagram_clip
-            else:  # tiktok
-                # TikTok: Use full-length vertical format
-                platform_clip = tiktok_clip
-            
-            # Export video
-            export_video(platform_clip, output_path, platform)
+            output_path = output_paths[platform]
+
+            if config.CTA_ENABLED:
+                # MoviePy path: the CTA overlay is burned into the composite
+                if platform == "youtube":
+                    platform_clip = youtube_clip
+                elif platform == "instagram":
+                    platform_clip = instagram_clip
+                else:  # tiktok
+                    platform_clip = tiktok_clip
+
+                encode_key = (id(platform_clip), get_platform_bitrate(platform, platform_clip.duration))
+                if encode_key in exported_encodes:
+                    clone_exported_video(exported_encodes[encode_key], output_path, platform)
+                else:
+                    export_video(platform_clip, output_path, platform)
+                    exported_encodes[encode_key] = output_path
             
             # Generate and save metadata
-            metadata = generate_metadata(video_name, platform, amazon_link)
+            metadata = generate_metadata(video_name, platform, amazon_link, title=title)
             save_metadata(metadata, output_path, platform)
             
             # Store metadata for upload step
@@ -803,73 +1551,71 @@ def process_video(input_path: Path, archive: bool = True) -> bool:
                 'path': output_path,
                 'metadata': metadata
             }
+
+            # Start this platform's upload now; it overlaps the next encode
+            # (upload_and_record saves its own result, so a shared pool
+            # can finish it long after this function returns)
+            if upload_enabled and platform in config.UPLOAD_PLATFORMS:
+                future = upload_executor.submit(
+                    upload_and_record,
+                    platform, output_path, metadata, video_name
+                )
+                if owns_upload_pool:
+                    upload_futures[platform] = future
         
-        # Cleanup
+        # Cleanup: release the decoders before waiting on network I/O
+        # (youtube_clip/tiktok_clip are shared references, registered once)
         print("\nCleaning up...")
-        if clip:
-            clip.close()
-        if instagram_clip:
-            instagram_clip.close()
-        if tiktok_clip:
-            tiktok_clip.close()
-        # Note: youtube_clip is just a reference to clip, so no need to close separately
-        
-        # Step 9: Upload to platforms (if enabled)
-        if config.AUTO_UPLOAD_ENABLED and UPLOADERS_AVAILABLE:
-            print(f"\n{'='*60}")
-            print("Step 9: Uploading videos to platforms...")
-            print(f"{'='*60}")
-            print(f"Configured platforms: {', '.join(config.UPLOAD_PLATFORMS)}")
-            print(f"{'='*60}\n")
-            
-            upload_results = upload_videos(uploaded_videos, video_name)
-            
-            # Save upload results to metadata
-            for platform, result in upload_results.items():
-                if result:
-                    metadata_path = uploaded_videos[platform]['path'].with_suffix('.json')
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    metadata['upload'] = result
-                    with open(metadata_path, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-        elif config.AUTO_UPLOAD_ENABLED and not UPLOADERS_AVAILABLE:
+        clip_stack.close()
+
+        # Step 9: Collect upload results (uploads were kicked off during
+        # the export loop and have been running in the background; each
+        # task saves its own result into the metadata file as it lands)
+        if upload_futures:
+            print(f"\n{'='*60}\nStep 9: Waiting for platform uploads...\n{'='*60}\n"
+                  f"Configured platforms: {', '.join(config.UPLOAD_PLATFORMS)}\n"
+                  f"{'='*60}\n")
+
+            for platform, future in upload_futures.items():
+                future.result()  # upload_and_record never raises
+
+            # All uploads for this run are in - bulk-delete the
+            # temporary S3 copies they queued
+            _flush_upload_cleanup()
+        elif upload_enabled and not owns_upload_pool:
+            print("\nStep 9: Uploads continue in the background (shared batch pool)")
+        elif config.AUTO_UPLOAD_ENABLED and not upload_enabled:
             print("\nWarning: Upload enabled but uploaders not available")
             print("  Install required packages: pip install -r requirements.txt")
+
+        if upload_executor is not None and owns_upload_pool:
+            upload_executor.shutdown()
         
         # Archive the video if requested
         if archive:
             print("\nArchiving source video...")
-            archive_video(input_path)
+            archive_video(input_path, now=started_at)
         
-        print(f"\n{'='*60}")
-        print("[OK] Processing complete!")
-        print(f"{'='*60}\n")
-        
-        log_processing(video_name, "success")
+        print(f"\n{'='*60}\n[OK] Processing complete!\n{'='*60}\n")
+
+        log_processing(video_name, "success", now=started_at)
         return True
         
     except Exception as e:
         error_msg = str(e)
-        print(f"\n{'='*60}")
-        print(f"[ERROR] Processing failed: {error_msg}")
-        print(f"{'='*60}\n")
-        
-        # Cleanup on error
-        try:
-            if clip:
-                clip.close()
-            if 'instagram_clip' in locals() and instagram_clip:
-                instagram_clip.close()
-            if 'tiktok_clip' in locals() and tiktok_clip:
-                tiktok_clip.close()
-            if final_clip:
-                final_clip.close()
-        except:
-            pass
-        
-        log_processing(video_name, "failed", error_msg)
+        print(f"\n{'='*60}\n[ERROR] Processing failed: {error_msg}\n{'='*60}\n")
+
+        # Don't leave upload threads running past a failed video (a
+        # shared batch pool stays up - it may carry other videos' uploads)
+        if upload_executor is not None and owns_upload_pool:
+            upload_executor.shutdown(cancel_futures=True)
+
+        log_processing(video_name, "failed", error_msg, now=started_at)
         return False
+    finally:
+        # No-op after the success path's early close; on failure this is
+        # what tears the decoders down
+        clip_stack.close()
 
 
 def process_batch(input_folder: Path = None, archive: bool = True):
@@ -889,51 +1635,110 @@ def process_batch(input_folder: Path = None, archive: bool = True):
         print(f"Error: Input folder not found: {input_folder}")
         return
     
-    # Find all video files
-    video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.m4v'}
-    video_files = [
-        f for f in input_folder.iterdir()
-        if f.is_file() and f.suffix.lower() in video_extensions
-    ]
+    # Find all video files. os.scandir returns entries with cached stat
+    # info from one getdents call - iterdir + is_file + suffix would pay a
+    # stat syscall per entry, which adds up on large or networked folders.
+    # Name check runs first: on filesystems without cached d_type info,
+    # is_file() needs a stat, and most entries in a mixed folder aren't
+    # videos. The endswith fast path skips the split+lower for the
+    # overwhelmingly common all-lowercase .mp4 case.
+    with os.scandir(input_folder) as entries:
+        video_files = []
+        for entry in entries:
+            name = entry.name
+            if not (name.endswith('.mp4')
+                    or name.rsplit('.', 1)[-1].lower() in VIDEO_EXTENSIONS):
+                continue
+            if entry.is_file(follow_symlinks=False):
+                video_files.append(Path(entry.path))
     
     if not video_files:
         print(f"No video files found in {input_folder}")
         return
     
-    print(f"\n{'='*60}")
-    print(f"BATCH PROCESSING: Found {len(video_files)} video(s)")
-    print(f"{'='*60}\n")
-    
+    print(f"\n{'='*60}\nBATCH PROCESSING: Found {len(video_files)} video(s)\n{'='*60}\n")
+
     results = {"success": 0, "failed": 0, "failed_files": []}
-    
-    for i, video_file in enumerate(video_files, 1):
-        print(f"\n[{i}/{len(video_files)}] Processing: {video_file.name}")
-        success = process_video(video_file, archive=archive)
-        
-        if success:
-            results["success"] += 1
+
+    # Each video is an independent job, so batches run on a process pool.
+    # Worker count: config override, else 2 with a hardware encoder (the
+    # GPU is the bottleneck and NVENC allows 2-3 sessions), else leave a
+    # core free for the OS. Never more workers than videos.
+    workers = config.BATCH_PARALLELISM
+    if workers <= 0:
+        if VIDEO_CODEC in _HW_PRESETS:
+            workers = 2
         else:
-            results["failed"] += 1
-            results["failed_files"].append(video_file.name)
-    
-    # Summary
-    print(f"\n{'='*60}")
-    print("BATCH PROCESSING SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total videos: {len(video_files)}")
-    print(f"Successful: {results['success']}")
-    print(f"Failed: {results['failed']}")
-    
+            workers = max(1, multiprocessing.cpu_count() - 1)
+    workers = min(workers, len(video_files))
+
+    if workers == 1:
+        # Serial encodes still overlap with uploads: a shared pool lets
+        # video j's network time hide behind video j+1's encode instead
+        # of stalling the CPU between videos
+        upload_pool = None
+        if config.AUTO_UPLOAD_ENABLED and _uploaders_available():
+            from concurrent.futures import ThreadPoolExecutor
+            upload_pool = ThreadPoolExecutor(max_workers=2,
+                                             thread_name_prefix="upload")
+
+        for i, video_file in enumerate(video_files, 1):
+            print(f"\n[{i}/{len(video_files)}] Processing: {video_file.name}")
+            success = process_video(video_file, archive=archive,
+                                    upload_pool=upload_pool)
+
+            if success:
+                results["success"] += 1
+            else:
+                results["failed"] += 1
+                results["failed_files"].append(video_file.name)
+
+        if upload_pool is not None:
+            print("\nWaiting for remaining background uploads...")
+            upload_pool.shutdown(wait=True)
+            _flush_upload_cleanup()
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        print(f"Processing {workers} videos at a time (BATCH_PARALLELISM)\n")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_video, video_file, archive): video_file
+                for video_file in video_files
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                video_file = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Worker crashed on {video_file.name}: {e}")
+                    success = False
+
+                print(f"\n[{i}/{len(video_files)}] Finished: {video_file.name}")
+                if success:
+                    results["success"] += 1
+                else:
+                    results["failed"] += 1
+                    results["failed_files"].append(video_file.name)
+    
+    # Summary, assembled into a single write
+    summary = [
+        f"\n{'='*60}",
+        "BATCH PROCESSING SUMMARY",
+        '=' * 60,
+        f"Total videos: {len(video_files)}",
+        f"Successful: {results['success']}",
+        f"Failed: {results['failed']}",
+    ]
     if results["failed_files"]:
-        print(f"\nFailed files:")
-        for filename in results["failed_files"]:
-            print(f"  - {filename}")
-    
-    print(f"{'='*60}\n")
+        summary.append("\nFailed files:")
+        summary.extend(f"  - {filename}" for filename in results["failed_files"])
+    summary.append(f"{'='*60}\n")
+    print("\n".join(summary))
 
 
-def main():
-    """Main CLI entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser (importable for introspection/tests)."""
     parser = argparse.ArgumentParser(
         description="Process Amazon review videos for social media platforms",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -973,7 +1778,8 @@ Examples:
     parser.add_argument(
         "--no-archive",
         action="store_true",
-        help="Don't archive videos after processing"
+        help="Don't archive videos after processing "
+             "(archiving is a same-filesystem rename, so it's near-free)"
     )
     parser.add_argument(
         "--upload",
@@ -985,9 +1791,22 @@ Examples:
         action="store_true",
         help="Skip uploading videos (overrides AUTO_UPLOAD_ENABLED setting)"
     )
-    
-    args = parser.parse_args()
-    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Videos to process in parallel during --batch "
+             "(overrides BATCH_PARALLELISM; default: auto)"
+    )
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
+
+    # Create storage folders up front (config no longer does this at import)
+    config.ensure_output_folders()
+
     archive = not args.no_archive
     
     # Handle upload flag (overrides config)
@@ -995,7 +1814,20 @@ Examples:
         config.AUTO_UPLOAD_ENABLED = True
     elif args.no_upload:
         config.AUTO_UPLOAD_ENABLED = False
-    
+    if args.upload or args.no_upload:
+        # Mirror the override into the environment: batch workers under
+        # the spawn start method (Windows/macOS) re-import config from
+        # .env and would otherwise silently ignore the flag. Real
+        # environment variables take precedence over .env in env_cache,
+        # so spawned children pick this up - the same way
+        # _detect_video_encoder shares _DETECTED_VIDEO_CODEC.
+        os.environ["AUTO_UPLOAD_ENABLED"] = (
+            "true" if config.AUTO_UPLOAD_ENABLED else "false")
+
+    # Handle jobs flag (overrides config; process_batch reads this)
+    if args.jobs is not None:
+        config.BATCH_PARALLELISM = max(1, args.jobs)
+
     # Batch processing mode
     if args.batch:
         input_folder = Path(args.input_folder) if args.input_folder else None
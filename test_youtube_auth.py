@@ -5,7 +5,6 @@ This will trigger the OAuth flow and open a browser window.
 
 import os
 from pathlib import Path
-from uploaders.youtube_uploader import YouTubeUploader
 
 print("=" * 60)
 print("YouTube Authentication Test")
@@ -39,6 +38,10 @@ print("       Please sign in with your Google account and grant permissions.")
 print("       After you complete the sign-in, this script will continue.\n")
 
 try:
+    # Import here (not at the top) so the Google API client libraries are
+    # only loaded once the credential checks have passed
+    from uploaders.youtube_uploader import YouTubeUploader
+
     uploader = YouTubeUploader()
     success = uploader.authenticate()
 
@@ -0,0 +1,119 @@
+"""
+Shared TikTok token verification helper.
+
+check_tiktok_token.py and diagnose_tiktok.py both need the same two checks:
+the /v2/user/info/ call (is the token valid?) and the upload-init probe
+(is the video.upload scope authorized?). This module runs both concurrently
+on the shared session and caches the result for a few minutes, so running
+both scripts back-to-back in a session only hits the API once.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from tiktok_http import json_loads, run_verification_probes
+
+# Cache file for verification results (keyed by token hash)
+CACHE_FILE = Path("storage/tokens/tiktok_verify.json")
+
+# How long a cached verification stays fresh (seconds)
+CACHE_TTL = 300
+
+
+def _token_key(access_token: str) -> str:
+    """Hash the token so the cache file never stores it in plain text."""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+
+def _load_cached(access_token: str) -> dict:
+    """Return a fresh cached result for this token, or None."""
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("token_sha256") != _token_key(access_token):
+            return None
+        if time.time() - cached.get("timestamp", 0) > CACHE_TTL:
+            return None
+        return cached.get("result")
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached(access_token: str, result: dict):
+    """Persist the verification result (best effort - cache only)."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "token_sha256": _token_key(access_token),
+                "timestamp": time.time(),
+                "result": result
+            }, f, indent=2)
+    except OSError:
+        pass  # Cache write failure should never break verification
+
+
+def verify_tiktok(access_token: str, use_cache: bool = True) -> dict:
+    """
+    Verify a TikTok access token and its video.upload scope in one shot.
+
+    Issues the user-info check and the upload-init probe concurrently
+    (single round trip of wall time), and caches the result for CACHE_TTL
+    seconds so repeat invocations skip the network entirely.
+
+    Args:
+        access_token: TikTok OAuth2 access token
+        use_cache: Reuse a recent cached result if available
+
+    Returns:
+        Dictionary with:
+        - valid: True if the token passed the user-info check
+        - user: user dict (display_name, open_id, ...) or {}
+        - upload_scope: True if the upload-init probe succeeded
+        - user_info: {status, body, text} of the user-info response
+        - upload_probe: {status, body, text} of the upload-init response
+        - raw_errors: list of error strings collected from both calls
+    """
+    if use_cache:
+        cached = _load_cached(access_token)
+        if cached is not None:
+            return cached
+
+    user_response, probe_response = run_verification_probes(access_token)
+
+    def _parse(response):
+        try:
+            return json_loads(response.content)
+        except ValueError:
+            return {}
+
+    user_body = _parse(user_response)
+    probe_body = _parse(probe_response)
+
+    raw_errors = []
+    if user_response.status_code != 200:
+        raw_errors.append(f"user_info: {user_response.status_code} {user_response.text}")
+    if probe_response.status_code != 200:
+        raw_errors.append(f"upload_init: {probe_response.status_code} {probe_response.text}")
+
+    result = {
+        "valid": user_response.status_code == 200,
+        "user": user_body.get("data", {}).get("user", {}),
+        "upload_scope": probe_response.status_code == 200,
+        "user_info": {
+            "status": user_response.status_code,
+            "body": user_body,
+            "text": user_response.text
+        },
+        "upload_probe": {
+            "status": probe_response.status_code,
+            "body": probe_body,
+            "text": probe_response.text
+        },
+        "raw_errors": raw_errors
+    }
+
+    _save_cached(access_token, result)
+    return result
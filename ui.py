@@ -0,0 +1,17 @@
+"""
+Shared console formatting for the interactive setup/diagnostic scripts.
+
+Every script was rebuilding the same "=" * 70 / "-" * 70 rule strings
+inline dozens of times; build them once here and reuse.
+"""
+
+# 70-column rules used by the setup/diagnostic scripts
+BANNER = "=" * 70
+RULE = "-" * 70
+
+
+def section(title: str):
+    """Print a banner-framed section header."""
+    print(BANNER)
+    print(title)
+    print(BANNER)
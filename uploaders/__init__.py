@@ -5,17 +5,35 @@ This module provides upload functionality for:
 - YouTube Shorts
 - Instagram Reels
 - TikTok Videos
+
+Uploader classes are imported lazily (PEP 562): each platform drags in
+its own SDK stack (googleapiclient/OAuth, requests, boto3), several
+hundred ms of import time and tens of MB of RSS apiece, so nothing loads
+until the first attribute access - and touching one platform doesn't pay
+for the others.
 """
 
-from .base_uploader import BaseUploader
-from .youtube_uploader import YouTubeUploader
-from .instagram_uploader import InstagramUploader
-from .tiktok_uploader import TikTokUploader
+from importlib import import_module
+
+# Public class name -> submodule that defines it
+_SUBMODULES = {
+    'BaseUploader': 'base_uploader',
+    'YouTubeUploader': 'youtube_uploader',
+    'InstagramUploader': 'instagram_uploader',
+    'TikTokUploader': 'tiktok_uploader',
+}
+
+__all__ = list(_SUBMODULES)
 
-__all__ = [
-    'BaseUploader',
-    'YouTubeUploader',
-    'InstagramUploader',
-    'TikTokUploader',
-]
 
+def __getattr__(name):
+    """Import an uploader class on first access and cache it."""
+    try:
+        module_name = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # Subsequent accesses skip __getattr__
+    return value
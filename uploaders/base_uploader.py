@@ -2,6 +2,8 @@
 Base uploader class with common functionality for all platform uploaders.
 """
 
+import os
+import stat
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Optional
@@ -74,28 +76,35 @@ class BaseUploader(ABC):
         """
         pass
     
-    def validate_video_file(self, video_path: Path) -> bool:
+    def validate_video_file(self, video_path: Path):
         """
         Validate that the video file exists and is readable.
-        
+
+        One os.stat supplies existence, file type and size together (the
+        exists/is_file/stat chain cost three syscalls per video, which
+        adds up on networked storage).
+
         Args:
             video_path: Path to video file
-            
+
         Returns:
-            True if valid, False otherwise
+            The (truthy) os.stat_result if valid, False otherwise -
+            callers can reuse st_size without re-statting
         """
-        if not video_path.exists():
+        try:
+            st = os.stat(video_path)
+        except OSError:
             print(f"  Error: Video file not found: {video_path}")
             return False
-        
-        if not video_path.is_file():
+
+        if not stat.S_ISREG(st.st_mode):
             print(f"  Error: Path is not a file: {video_path}")
             return False
-        
+
         # Check file size (some platforms have limits)
-        file_size_mb = video_path.stat().st_size / (1024 * 1024)
+        file_size_mb = st.st_size / (1024 * 1024)
         if file_size_mb > 2000:  # 2GB limit (adjust per platform)
             print(f"  Warning: File size ({file_size_mb:.1f}MB) may exceed platform limits")
-        
-        return True
+
+        return st
 
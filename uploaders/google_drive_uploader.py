@@ -6,7 +6,6 @@ so they can be used with Instagram Graph API (which requires video_url).
 """
 
 import os
-import io
 from pathlib import Path
 from typing import Optional, Dict
 from google.oauth2.credentials import Credentials
@@ -17,6 +16,13 @@ from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 import config
 
+# Resumable-upload tuning: 8MB chunks keep memory bounded by the chunk
+# (the client library otherwise buffers ~100MB per request) and pipeline
+# better with TCP windows on high-latency links. Files under 5MB skip
+# the resumable session's extra init round-trip entirely.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
 
 class GoogleDriveUploader:
     """
@@ -33,6 +39,10 @@ class GoogleDriveUploader:
         self.service = None
         self.credentials = None
         self.authenticated = False
+        # folder name -> Drive folder ID, resolved once per run (the
+        # uploader instance is shared, so batches skip the files().list
+        # round-trip on every upload after the first)
+        self._folder_cache = {}
     
     def authenticate(self) -> bool:
         """
@@ -70,9 +80,19 @@ class GoogleDriveUploader:
                         client_secrets_file, self.SCOPES)
                     creds = flow.run_local_server(port=0)
                 
-                # Save credentials for next time
-                with open(token_file, 'w') as token:
-                    token.write(creds.to_json())
+                # Save credentials for next time. Write-to-temp + rename
+                # is atomic, so a process killed mid-write can't leave a
+                # truncated token that forces manual re-auth; identical
+                # content skips the disk write entirely.
+                new_json = creds.to_json()
+                try:
+                    unchanged = token_file.read_text() == new_json
+                except OSError:
+                    unchanged = False
+                if not unchanged:
+                    tmp_file = token_file.with_suffix('.json.tmp')
+                    tmp_file.write_text(new_json)
+                    os.replace(tmp_file, token_file)
             
             self.credentials = creds
             self.service = build('drive', 'v3', credentials=creds)
@@ -84,6 +104,46 @@ class GoogleDriveUploader:
             print(f"  Error authenticating with Google Drive: {e}")
             return False
     
+    def _build_media(self, video_path: Path) -> MediaFileUpload:
+        """Build the upload payload with chunked-resumable tuning."""
+        return MediaFileUpload(
+            str(video_path),
+            mimetype='video/mp4',
+            resumable=video_path.stat().st_size > RESUMABLE_THRESHOLD,
+            chunksize=UPLOAD_CHUNK_SIZE
+        )
+
+    def _upload_file(self, file_metadata: Dict, media: MediaFileUpload,
+                     fields: str) -> Dict:
+        """
+        Drive a files().create() upload to completion.
+
+        Resumable uploads are stepped chunk-by-chunk so each chunk gets
+        the client library's built-in exponential-backoff retry
+        (num_retries) instead of one all-or-nothing execute(); small
+        non-resumable uploads finish in the single request.
+
+        Args:
+            file_metadata: Drive file metadata (name, parents)
+            media: Upload payload from _build_media()
+            fields: Response fields to request
+
+        Returns:
+            The created file resource
+        """
+        request = self.service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields=fields
+        )
+        if not media.resumable():
+            return request.execute()
+
+        response = None
+        while response is None:
+            _, response = request.next_chunk(num_retries=3)
+        return response
+
     def upload_video_and_get_url(
         self,
         video_path: Path,
@@ -119,18 +179,9 @@ class GoogleDriveUploader:
                 'parents': [folder_id]
             }
             
-            media = MediaFileUpload(
-                str(video_path),
-                mimetype='video/mp4',
-                resumable=True
-            )
-            
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, webViewLink'
-            ).execute()
-            
+            media = self._build_media(video_path)
+            file = self._upload_file(file_metadata, media, 'id, name')
+
             file_id = file.get('id')
             print(f"  [OK] Video uploaded to Google Drive (ID: {file_id})")
             
@@ -146,29 +197,13 @@ class GoogleDriveUploader:
                 body=permission
             ).execute()
             
-            # Step 4: Get direct download URL
-            # Instagram needs a direct download URL that it can access
-            # We'll use webContentLink which is the direct download link
-            
-            file_info = self.service.files().get(
-                fileId=file_id,
-                fields='webContentLink, webViewLink, mimeType, size'
-            ).execute()
-            
-            # Use webContentLink - this is the direct download URL
-            web_content_link = file_info.get('webContentLink')
-            
-            if web_content_link:
-                # Remove the "&confirm=t" parameter if present (causes issues)
-                # webContentLink format: https://drive.google.com/uc?id=FILE_ID&export=download
-                public_url = web_content_link.split('&confirm=')[0]
-                print(f"  [OK] Using direct download URL: {public_url[:60]}...")
-                return public_url
-            
-            # Fallback: Construct direct download URL manually
-            # Format: https://drive.google.com/uc?id=FILE_ID&export=download
+            # Step 4: Build the direct download URL
+            # Instagram needs a direct download URL that it can access.
+            # webContentLink is always uc?id=FILE_ID&export=download, so
+            # construct it from the file ID we already have instead of
+            # spending another files().get() round-trip to read it back.
             direct_url = f"https://drive.google.com/uc?id={file_id}&export=download"
-            print(f"  [OK] Using constructed direct URL: {direct_url[:60]}...")
+            print(f"  [OK] Using direct download URL: {direct_url[:60]}...")
             return direct_url
                 
         except HttpError as e:
@@ -190,31 +225,39 @@ class GoogleDriveUploader:
         Returns:
             Folder ID, or None if failed
         """
+        cached = self._folder_cache.get(folder_name)
+        if cached:
+            return cached
+
         try:
             # Check if folder already exists
             results = self.service.files().list(
                 q=f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false",
                 fields="files(id, name)"
             ).execute()
-            
+
             folders = results.get('files', [])
-            
+
             if folders:
+                self._folder_cache[folder_name] = folders[0]['id']
                 return folders[0]['id']
-            
+
             # Create new folder
             folder_metadata = {
                 'name': folder_name,
                 'mimeType': 'application/vnd.google-apps.folder'
             }
-            
+
             folder = self.service.files().create(
                 body=folder_metadata,
                 fields='id'
             ).execute()
-            
-            return folder.get('id')
-            
+
+            folder_id = folder.get('id')
+            if folder_id:
+                self._folder_cache[folder_name] = folder_id
+            return folder_id
+
         except Exception as e:
             print(f"  Error creating folder: {e}")
             return None
@@ -253,18 +296,9 @@ class GoogleDriveUploader:
                 'parents': [folder_id]
             }
             
-            media = MediaFileUpload(
-                str(video_path),
-                mimetype='video/mp4',
-                resumable=True
-            )
-            
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name'
-            ).execute()
-            
+            media = self._build_media(video_path)
+            file = self._upload_file(file_metadata, media, 'id, name')
+
             file_id = file.get('id')
             print(f"  [OK] Video backed up to Google Drive (ID: {file_id})")
             return file_id
@@ -9,13 +9,165 @@ Requires:
 
 import os
 import json
+import struct
+import subprocess
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Dict, Optional
 import config
 from .base_uploader import BaseUploader
 
+# orjson parses small JSON payloads several times faster than stdlib
+# json (C extension); optional - response parsing falls back to
+# requests' built-in .json() when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_json(response) -> Dict:
+    """Parse a Graph API response body, preferring orjson.
+
+    Works on response.content directly, skipping requests' charset
+    detection pass (Graph API is always UTF-8 JSON).
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _probe_duration(video_path: Path) -> Optional[float]:
+    """
+    Read a video's duration in seconds without decoding it.
+
+    ffprobe only parses the container header - unlike moviepy, which
+    drags in numpy/imageio and opens a full decoder context just to
+    expose one float. Falls back to walking the MP4 atoms directly
+    when ffprobe isn't installed.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Duration in seconds, or None if it couldn't be determined
+    """
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", str(video_path)],
+            capture_output=True, text=True
+        )
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (FileNotFoundError, ValueError):
+        pass
+    return _mp4_duration(video_path)
+
+
+def _mp4_duration(video_path: Path) -> Optional[float]:
+    """Read duration from the MP4 moov/mvhd header (no external tools)."""
+    try:
+        with open(video_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+
+            def seek_into(name, end):
+                """Scan sibling atoms for `name`; leave f at its payload."""
+                while f.tell() < end:
+                    header = f.read(8)
+                    if len(header) < 8:
+                        return None
+                    size, atom = struct.unpack('>I4s', header)
+                    if size == 1:  # 64-bit extended size
+                        size = struct.unpack('>Q', f.read(8))[0] - 16
+                    elif size == 0:  # atom runs to end of file
+                        size = end - f.tell()
+                    else:
+                        size -= 8
+                    payload_start = f.tell()
+                    if atom == name:
+                        return payload_start + size
+                    f.seek(payload_start + size)
+                return None
+
+            moov_end = seek_into(b'moov', file_size)
+            if moov_end is None:
+                return None
+            if seek_into(b'mvhd', moov_end) is None:
+                return None
+            version = f.read(1)[0]
+            f.seek(3, 1)  # flags
+            if version == 1:
+                f.seek(16, 1)  # 64-bit creation/modification times
+                timescale, duration = struct.unpack('>IQ', f.read(12))
+            else:
+                f.seek(8, 1)  # 32-bit creation/modification times
+                timescale, duration = struct.unpack('>II', f.read(8))
+            if timescale:
+                return duration / timescale
+    except (OSError, struct.error, IndexError):
+        pass
+    return None
+
+
+# (connect, read) timeout for every Graph API request - without one, a
+# hung response blocks the uploader (and its worker slot) indefinitely.
+# 3.05s connect follows the requests docs' advice of sitting just past
+# a multiple of the 3s TCP retransmission window.
+HTTP_TIMEOUT = (3.05, 10)
+
+# Verbose request/response dumps are opt-in: they add several stdout
+# writes per polling iteration, and the stdout lock serializes threads
+# doing concurrent status polls. Errors and [OK] milestones always
+# print; set INSTAGRAM_DEBUG=true to see the full API chatter.
+_DEBUG = os.getenv("INSTAGRAM_DEBUG", "").lower() in ("1", "true", "yes")
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket for pacing Graph API requests.
+
+    Instagram enforces leaky-bucket rate limits per endpoint, and
+    tripping them brings 429 throttling that slows every subsequent
+    call - pacing proactively is faster end-to-end than retrying
+    reactively. Usable as a context manager around a request.
+    """
+
+    def __init__(self, rate_per_sec: float = 0.5, burst: int = 4):
+        self.rate = rate_per_sec
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
 
 class InstagramUploader(BaseUploader):
     """
@@ -26,28 +178,158 @@ class InstagramUploader(BaseUploader):
     1. Create media container
     2. Publish the container (or leave as draft)
     """
-    
+
+    # How long a successful /me token check stays trusted. Long-lived
+    # tokens last 60 days, so re-verifying within the hour is wasted
+    # round-trips; a token revoked mid-window still fails loudly at the
+    # next real API call.
+    AUTH_TTL_SECONDS = 3600
+
+    # Shared across all instances (and the batch-poll worker threads)
+    # so the whole process respects one sustainable request rate.
+    _bucket = _TokenBucket(rate_per_sec=0.5, burst=4)
+
     def __init__(self):
         super().__init__("Instagram")
-        self.access_token = None
-        self.instagram_account_id = None
+        # Read credentials once at construction; authenticate() is
+        # re-invoked per video in batch runs and shouldn't re-walk the
+        # environment each time. Missing values are reported there,
+        # with setup instructions, rather than raising here.
+        self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
+        self.instagram_account_id = os.getenv("INSTAGRAM_ACCOUNT_ID")
         self.api_base = "https://graph.instagram.com"
         # Storage preference: s3 > google_drive > direct
         self.storage_type = os.getenv("INSTAGRAM_STORAGE_TYPE", "s3").lower()  # "s3", "google_drive", or "direct"
         self.last_s3_key = None  # Store S3 key for cleanup
-    
-    def authenticate(self) -> bool:
+        self._cleanup_enabled = os.getenv("INSTAGRAM_CLEANUP_S3", "true").lower() == "true"
+        self._s3_cleanup_client = None  # Authenticated once, then reused
+        self._pending_cleanup_keys = []  # Deleted in bulk by flush_s3_cleanup()
+        self._auth_checked_at = 0.0  # monotonic time of last /me success
+        # One pooled session for every Graph API call: keep-alive reuses
+        # the TCP+TLS connection across the auth probe, container
+        # create, the status polls and publish, so only the first
+        # request pays the handshake. Transient 429/5xx responses get a
+        # few backoff retries at the transport layer.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # GET/HEAD only: container-create and publish POSTs are
+                # not idempotent, so transport-level replays could
+                # double-publish. Retry-After on 429s is honored.
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True,
+            ),
+        ))
+
+    def close(self) -> None:
+        """Flush deferred S3 cleanup and release the pooled connections."""
+        self.flush_s3_cleanup()
+        self.session.close()
+
+    @staticmethod
+    def _next_delay(poll_count: int, response=None) -> float:
+        """
+        Seconds to wait before the next container status poll.
+
+        Exponential backoff from 2s capped at 15s: short reels that
+        finish in 10-20s are noticed within seconds instead of on the
+        next fixed 10s tick, while long processing backs off and cuts
+        the request count roughly 3x. A Retry-After header (throttling)
+        overrides the schedule.
+
+        Args:
+            poll_count: Number of polls already issued
+            response: Last poll response, checked for Retry-After
+
+        Returns:
+            Delay in seconds
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return max(1.0, float(retry_after))
+                except ValueError:
+                    pass
+        return min(15.0, 2.0 * (1.5 ** poll_count))
+
+    @staticmethod
+    def _backup_to_drive(video_path: Path) -> None:
+        """Back the video up to Google Drive (best-effort, never raises)."""
+        print(f"  Uploading video to Google Drive for backup...")
+        try:
+            from .google_drive_uploader import GoogleDriveUploader
+            drive_uploader = GoogleDriveUploader()
+            drive_file_id = drive_uploader.upload_video_for_backup(video_path)
+            if drive_file_id:
+                print(f"  [OK] Video backed up to Google Drive")
+            else:
+                print(f"  Warning: Google Drive backup failed, continuing anyway...")
+        except ImportError:
+            print(f"  Warning: Google Drive uploader not available, skipping backup")
+        except Exception as e:
+            print(f"  Warning: Google Drive backup failed: {e}, continuing anyway...")
+
+    def _cleanup_s3_if_enabled(self) -> None:
+        """
+        Queue the temporary S3 copy of the last uploaded video for
+        deletion.
+
+        Deletion is deferred: the keys accumulate on the instance and
+        flush_s3_cleanup() removes them in one bulk delete_objects
+        call at end-of-run, so a batch pays one round-trip instead of
+        one DeleteObject per video.
+        """
+        if not self.last_s3_key or not self._cleanup_enabled:
+            return
+        self._pending_cleanup_keys.append(self.last_s3_key)
+        self.last_s3_key = None
+
+    def flush_s3_cleanup(self) -> None:
+        """
+        Bulk-delete every queued temporary S3 file (best-effort).
+
+        The authenticated S3 client is cached on the instance, so
+        repeated flushes in a batch run don't rebuild a boto3 client
+        and re-resolve credentials every time.
+        """
+        if not self._pending_cleanup_keys:
+            return
+        keys, self._pending_cleanup_keys = self._pending_cleanup_keys, []
+        try:
+            if self._s3_cleanup_client is None:
+                from .s3_uploader import S3Uploader
+                client = S3Uploader()
+                if not client.authenticate():
+                    return
+                self._s3_cleanup_client = client
+            self._s3_cleanup_client.delete_files(keys)
+        except Exception as cleanup_error:
+            print(f"  Warning: Could not cleanup S3 files: {cleanup_error}")
+
+    def authenticate(self, force: bool = False) -> bool:
         """
         Authenticate with Instagram Graph API.
-        
+
+        Args:
+            force: Re-verify the token even if a recent check succeeded
+
         Returns:
             True if authentication successful, False otherwise
         """
+        # A recent successful /me check means the token is still good;
+        # skip the network round-trip for repeat calls within the TTL
+        # (upload_video re-authenticates per video in batch runs).
+        if (not force and self.authenticated
+                and time.monotonic() - self._auth_checked_at < self.AUTH_TTL_SECONDS):
+            return True
+
         try:
-            # Get access token from environment
-            self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
-            self.instagram_account_id = os.getenv("INSTAGRAM_ACCOUNT_ID")
-            
             if not self.access_token:
                 print("  Error: INSTAGRAM_ACCESS_TOKEN not set in .env")
                 print("  Please get a long-lived access token from Facebook Graph API Explorer")
@@ -59,19 +341,21 @@ class InstagramUploader(BaseUploader):
                 return False
             
             # Verify token is valid
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/me",
-                params={"access_token": self.access_token, "fields": "id,username"}
+                params={"access_token": self.access_token, "fields": "id,username"},
+                timeout=HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 print(f"  [OK] Authenticated with Instagram API")
                 print(f"  Account: {data.get('username', 'N/A')}")
                 self.authenticated = True
+                self._auth_checked_at = time.monotonic()
                 return True
             else:
-                error_data = response.json() if response.text else {}
+                error_data = _parse_json(response) if response.content else {}
                 error_message = error_data.get('error', {}).get('message', 'Unknown error')
                 print(f"  Error: Invalid access token - {response.status_code}")
                 print(f"  Error message: {error_message}")
@@ -91,23 +375,26 @@ class InstagramUploader(BaseUploader):
             print(f"  Error authenticating with Instagram: {e}")
             return False
     
-    def validate_video_file(self, video_path: Path) -> bool:
+    def validate_video_file(self, video_path: Path):
         """
         Validate video file meets Instagram Reels requirements.
-        
+
         Args:
             video_path: Path to video file
-            
+
         Returns:
-            True if valid, False otherwise
+            The (truthy) os.stat_result if valid, False otherwise
         """
-        # Check base validation (file exists, etc.)
-        if not super().validate_video_file(video_path):
+        # Check base validation (file exists, etc.); reuse its stat
+        # result instead of paying a second syscall for the size
+        st = super().validate_video_file(video_path)
+        if not st:
             return False
-        
-        # Check file size (Instagram Reels: max 100MB)
-        file_size_mb = video_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 100:
+
+        # Check file size (Instagram Reels: max 100MB); integer compare,
+        # MB conversion only happens for the error message
+        if st.st_size > 100 * 1024 * 1024:
+            file_size_mb = st.st_size / (1024 * 1024)
             print(f"  Error: File size ({file_size_mb:.1f}MB) exceeds Instagram Reels limit (100MB)")
             print(f"  Suggestion: The video was encoded with dynamic bitrate, but it's still too large.")
             print(f"  This may happen with very long videos. Consider:")
@@ -116,24 +403,18 @@ class InstagramUploader(BaseUploader):
             return False
         
         # Check video duration (Instagram Reels: 15-90 seconds)
-        try:
-            from moviepy.editor import VideoFileClip
-            with VideoFileClip(str(video_path)) as clip:
-                duration = clip.duration
-                if duration < 15:
-                    print(f"  Error: Video duration ({duration:.1f}s) is too short for Instagram Reels (min 15s)")
-                    return False
-                if duration > 90:
-                    print(f"  Error: Video duration ({duration:.1f}s) exceeds Instagram Reels limit (max 90s)")
-                    return False
-        except ImportError:
-            # moviepy not available, skip duration check
-            pass
-        except Exception as e:
-            print(f"  Warning: Could not check video duration: {e}")
+        duration = _probe_duration(video_path)
+        if duration is None:
             # Continue anyway - duration check is not critical
-        
-        return True
+            print(f"  Warning: Could not check video duration")
+        elif duration < 15:
+            print(f"  Error: Video duration ({duration:.1f}s) is too short for Instagram Reels (min 15s)")
+            return False
+        elif duration > 90:
+            print(f"  Error: Video duration ({duration:.1f}s) exceeds Instagram Reels limit (max 90s)")
+            return False
+
+        return st
     
     def upload_video(
         self,
@@ -168,48 +449,43 @@ class InstagramUploader(BaseUploader):
             caption = description
             # Don't add tags again - they're already in the description from get_instagram_caption()
             
-            # Step 1: Upload to Google Drive for backup (always do this)
-            print(f"  Uploading video to Google Drive for backup...")
-            try:
-                from .google_drive_uploader import GoogleDriveUploader
-                drive_uploader = GoogleDriveUploader()
-                drive_file_id = drive_uploader.upload_video_for_backup(video_path)
-                if drive_file_id:
-                    print(f"  [OK] Video backed up to Google Drive")
-                else:
-                    print(f"  Warning: Google Drive backup failed, continuing anyway...")
-            except ImportError:
-                print(f"  Warning: Google Drive uploader not available, skipping backup")
-            except Exception as e:
-                print(f"  Warning: Google Drive backup failed: {e}, continuing anyway...")
-            
-            # Step 2: Get video URL for Instagram (upload to S3)
+            # Steps 1+2: the Google Drive backup and the S3 upload are
+            # independent I/O-bound passes over the same file, and both
+            # sit on the critical path before any Graph API call - run
+            # them in parallel so the wait is max(drive, s3) rather
+            # than their sum. _backup_to_drive never raises, so the
+            # future only needs to be awaited.
             video_url = None
             self.last_s3_key = None  # Reset for cleanup tracking
-            
-            if self.storage_type == "s3":
-                print(f"  Uploading video to AWS S3 for Instagram...")
-                try:
-                    from .s3_uploader import S3Uploader
-                    s3_uploader = S3Uploader()
-                    video_url = s3_uploader.upload_video_and_get_url(video_path)
-                    
-                    if not video_url:
-                        print(f"  Error: Failed to upload to S3")
-                        return None
-                    
-                    # Store S3 key for cleanup
-                    self.last_s3_key = getattr(s3_uploader, 'last_uploaded_key', None)
-                    print(f"  [OK] Video uploaded to S3, got public URL")
-                except ImportError:
-                    print(f"  Error: S3 uploader not available")
-                    print(f"  Install: pip install boto3")
-                    print(f"  Falling back to Google Drive...")
-                    self.storage_type = "google_drive"
-                except Exception as e:
-                    print(f"  Error uploading to S3: {e}")
-                    print(f"  Falling back to Google Drive...")
-                    self.storage_type = "google_drive"
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                backup_future = pool.submit(self._backup_to_drive, video_path)
+
+                if self.storage_type == "s3":
+                    print(f"  Uploading video to AWS S3 for Instagram...")
+                    try:
+                        from .s3_uploader import S3Uploader
+                        s3_uploader = S3Uploader()
+                        video_url = s3_uploader.upload_video_and_get_url(video_path)
+
+                        if not video_url:
+                            print(f"  Error: Failed to upload to S3")
+                            return None
+
+                        # Store S3 key for cleanup
+                        self.last_s3_key = getattr(s3_uploader, 'last_uploaded_key', None)
+                        print(f"  [OK] Video uploaded to S3, got public URL")
+                    except ImportError:
+                        print(f"  Error: S3 uploader not available")
+                        print(f"  Install: pip install boto3")
+                        print(f"  Falling back to Google Drive...")
+                        self.storage_type = "google_drive"
+                    except Exception as e:
+                        print(f"  Error uploading to S3: {e}")
+                        print(f"  Falling back to Google Drive...")
+                        self.storage_type = "google_drive"
+
+                backup_future.result()
             
             if self.storage_type == "google_drive" and not video_url:
                 print(f"  Uploading video to Google Drive for Instagram URL...")
@@ -254,7 +530,9 @@ class InstagramUploader(BaseUploader):
                     'access_token': self.access_token
                 }
                 
-                response = requests.post(upload_url, data=data, params=params)
+                with self._bucket:
+                    response = self.session.post(upload_url, data=data, params=params,
+                                                 timeout=HTTP_TIMEOUT)
             else:
                 # Try direct file upload (usually doesn't work)
                 with open(video_path, 'rb') as video_file:
@@ -272,18 +550,19 @@ class InstagramUploader(BaseUploader):
                         'access_token': self.access_token
                     }
                     
-                    response = requests.post(
+                    response = self.session.post(
                         upload_url,
                         files=files,
                         data=data,
-                        params=params
+                        params=params,
+                        timeout=HTTP_TIMEOUT
                     )
             
             if response.status_code != 200:
                 print(f"  Error creating media container: {response.status_code}")
                 print(f"  Response: {response.text}")
                 
-                error_data = response.json() if response.text else {}
+                error_data = _parse_json(response) if response.content else {}
                 error_message = error_data.get('error', {}).get('message', 'Unknown error')
                 
                 if 'video_url' in error_message.lower() and not video_url:
@@ -293,7 +572,7 @@ class InstagramUploader(BaseUploader):
                 
                 return None
             
-            container_data = response.json()
+            container_data = _parse_json(response)
             container_id = container_data.get('id')
             
             if not container_id:
@@ -305,63 +584,75 @@ class InstagramUploader(BaseUploader):
             
             # Step 2: Check container status until it's ready
             print(f"  Waiting for video processing...")
-            max_attempts = 30  # Wait up to 5 minutes (10 seconds * 30)
-            attempt = 0
+            max_wait = 300  # Same 5-minute cap as the old fixed-interval polling
+            poll_start = time.monotonic()
+            poll_count = 0
+            next_progress = 60.0  # Print a progress line once a minute
+            timed_out = True
             status_checked = False  # Track if we successfully checked status at least once
-            
-            while attempt < max_attempts:
-                status_response = requests.get(
-                    f"{self.api_base}/{container_id}",
-                    params={
-                        'access_token': self.access_token,
-                        'fields': 'status_code,status'  # error field doesn't exist on MediaBuilder
-                    }
-                )
+
+            # Constant across iterations - hoisted so repeated polls
+            # don't rebuild the same URL strings and params dicts
+            status_url = f"{self.api_base}/{container_id}"
+            status_params = {
+                'access_token': self.access_token,
+                'fields': 'status_code,status'  # error field doesn't exist on MediaBuilder
+            }
+            status_params_basic = {
+                'access_token': self.access_token,
+                'fields': 'status_code'
+            }
+            publish_url = f"{self.api_base}/{self.instagram_account_id}/media_publish"
+            publish_params = {
+                'creation_id': container_id,
+                'access_token': self.access_token
+            }
+            # Conditional-GET support: if the API tags responses with an
+            # ETag, unchanged polls come back as bodyless 304s. If it
+            # never does, this stays a no-op.
+            last_etag = None
+
+            while time.monotonic() - poll_start < max_wait:
+                with self._bucket:
+                    status_response = self.session.get(
+                        status_url, params=status_params, timeout=HTTP_TIMEOUT,
+                        headers={'If-None-Match': last_etag} if last_etag else None
+                    )
                 
                 if status_response.status_code == 200:
                     status_checked = True  # We successfully checked status
-                    status_data = status_response.json()
+                    last_etag = status_response.headers.get('ETag')
+                    status_data = _parse_json(status_response)
                     status_code = status_data.get('status_code')
                     status_message = status_data.get('status', '')
                     
                     if status_code == 'FINISHED':
                         print(f"  [OK] Video processed successfully!")
-                        print(f"  Status details: {status_data}")
-                        
+                        if _DEBUG:
+                            print(f"  Status details: {status_data}")
+
                         # Step 3: Publish the reel (required for it to appear in Instagram)
                         # Instagram Reels need to be published to appear, even as drafts
                         print(f"  Publishing reel (container ID: {container_id})...")
-                        publish_url = f"{self.api_base}/{self.instagram_account_id}/media_publish"
-                        publish_params = {
-                            'creation_id': container_id,
-                            'access_token': self.access_token
-                        }
-                        
-                        print(f"  Publish URL: {publish_url}")
-                        print(f"  Publish params: creation_id={container_id}")
-                        
-                        publish_response = requests.post(publish_url, params=publish_params)
-                        
-                        print(f"  Publish response status: {publish_response.status_code}")
-                        print(f"  Publish response: {publish_response.text[:200]}...")
-                        
+                        if _DEBUG:
+                            print(f"  Publish URL: {publish_url}")
+                            print(f"  Publish params: creation_id={container_id}")
+
+                        with self._bucket:
+                            publish_response = self.session.post(publish_url, params=publish_params,
+                                                                 timeout=HTTP_TIMEOUT)
+
+                        if _DEBUG:
+                            print(f"  Publish response status: {publish_response.status_code}")
+                            print(f"  Publish response: {publish_response.text[:200]}...")
+
                         if publish_response.status_code == 200:
-                            publish_result = publish_response.json()
+                            publish_result = _parse_json(publish_response)
                             media_id = publish_result.get('id')
                             print(f"  [OK] Reel published successfully!")
                             print(f"  Media ID: {media_id}")
                             
-                            # Cleanup S3 file if upload was successful and cleanup is enabled
-                            if self.last_s3_key:
-                                cleanup_enabled = os.getenv("INSTAGRAM_CLEANUP_S3", "true").lower() == "true"
-                                if cleanup_enabled:
-                                    try:
-                                        from .s3_uploader import S3Uploader
-                                        s3_uploader = S3Uploader()
-                                        if s3_uploader.authenticate():
-                                            s3_uploader.delete_file(self.last_s3_key)
-                                    except Exception as cleanup_error:
-                                        print(f"  Warning: Could not cleanup S3 file: {cleanup_error}")
+                            self._cleanup_s3_if_enabled()
                             
                             return {
                                 'container_id': container_id,
@@ -377,16 +668,7 @@ class InstagramUploader(BaseUploader):
                             print(f"  Note: Container is ready but not published. You may need to publish manually.")
                             
                             # Still cleanup S3 file
-                            if self.last_s3_key:
-                                cleanup_enabled = os.getenv("INSTAGRAM_CLEANUP_S3", "true").lower() == "true"
-                                if cleanup_enabled:
-                                    try:
-                                        from .s3_uploader import S3Uploader
-                                        s3_uploader = S3Uploader()
-                                        if s3_uploader.authenticate():
-                                            s3_uploader.delete_file(self.last_s3_key)
-                                    except Exception as cleanup_error:
-                                        print(f"  Warning: Could not cleanup S3 file: {cleanup_error}")
+                            self._cleanup_s3_if_enabled()
                             
                             return {
                                 'container_id': container_id,
@@ -416,7 +698,8 @@ class InstagramUploader(BaseUploader):
                         if video_url:
                             print(f"\n  Testing S3 URL accessibility...")
                             try:
-                                test_response = requests.head(video_url, timeout=10, allow_redirects=True)
+                                test_response = self.session.head(video_url, timeout=HTTP_TIMEOUT,
+                                                                  allow_redirects=True, stream=True)
                                 if test_response.status_code == 200:
                                     print(f"  [OK] S3 URL is accessible (Status: {test_response.status_code})")
                                     print(f"  Content-Type: {test_response.headers.get('Content-Type', 'unknown')}")
@@ -453,76 +736,82 @@ class InstagramUploader(BaseUploader):
                         }
                     else:
                         # Still processing: IN_PROGRESS, PUBLISHED, etc.
-                        attempt += 1
-                        if attempt % 6 == 0:  # Print every minute
-                            print(f"  Still processing... (attempt {attempt}/{max_attempts})")
-                        time.sleep(10)  # Wait 10 seconds before checking again
+                        elapsed = time.monotonic() - poll_start
+                        if elapsed >= next_progress:
+                            next_progress += 60.0
+                            print(f"  Still processing... ({int(elapsed)}s elapsed)")
+                        time.sleep(self._next_delay(poll_count, status_response))
+                        poll_count += 1
+                elif status_response.status_code == 304:
+                    # Unchanged since the last poll (conditional GET):
+                    # no body to decode, container is still processing
+                    status_checked = True
+                    elapsed = time.monotonic() - poll_start
+                    if elapsed >= next_progress:
+                        next_progress += 60.0
+                        print(f"  Still processing... ({int(elapsed)}s elapsed)")
+                    time.sleep(self._next_delay(poll_count, status_response))
+                    poll_count += 1
+                    continue
                 elif status_response.status_code == 400:
                     # 400 error might mean the container doesn't exist or field doesn't exist
-                    error_data = status_response.json() if status_response.text else {}
+                    error_data = _parse_json(status_response) if status_response.content else {}
                     error_msg = error_data.get('error', {}).get('message', 'Unknown error')
                     
                     # If it's about a field not existing, try without that field
                     if 'nonexisting field' in error_msg.lower():
                         print(f"  Warning: API field issue, retrying with basic fields...")
                         # Retry with just status_code
-                        retry_response = requests.get(
-                            f"{self.api_base}/{container_id}",
-                            params={
-                                'access_token': self.access_token,
-                                'fields': 'status_code'
-                            }
-                        )
+                        with self._bucket:
+                            retry_response = self.session.get(
+                                status_url, params=status_params_basic,
+                                timeout=HTTP_TIMEOUT
+                            )
                         if retry_response.status_code == 200:
                             status_checked = True  # We successfully checked status
-                            status_data = retry_response.json()
+                            status_data = _parse_json(retry_response)
                             status_code = status_data.get('status_code')
                             # Continue with status check
                             if status_code == 'FINISHED':
                                 print(f"  [OK] Video processed successfully!")
                                 
-                                # Cleanup S3 file if upload was successful and cleanup is enabled
-                                if self.last_s3_key:
-                                    cleanup_enabled = os.getenv("INSTAGRAM_CLEANUP_S3", "true").lower() == "true"
-                                    if cleanup_enabled:
-                                        try:
-                                            from .s3_uploader import S3Uploader
-                                            s3_uploader = S3Uploader()
-                                            if s3_uploader.authenticate():
-                                                s3_uploader.delete_file(self.last_s3_key)
-                                        except Exception as cleanup_error:
-                                            print(f"  Warning: Could not cleanup S3 file: {cleanup_error}")
-                                
+                                self._cleanup_s3_if_enabled()
+
+                                timed_out = False
                                 break
                             elif status_code == 'ERROR':
                                 print(f"  [ERROR] Video processing failed")
                                 print(f"  Container ID: {container_id}")
+                                timed_out = False
                                 break
                             else:
                                 # Still processing
-                                attempt += 1
-                                if attempt % 6 == 0:
-                                    print(f"  Still processing... (attempt {attempt}/{max_attempts})")
-                                time.sleep(10)
+                                elapsed = time.monotonic() - poll_start
+                                if elapsed >= next_progress:
+                                    next_progress += 60.0
+                                    print(f"  Still processing... ({int(elapsed)}s elapsed)")
+                                time.sleep(self._next_delay(poll_count, retry_response))
+                                poll_count += 1
                                 continue
                     
                     # If retry didn't work or it's a different error, log and continue
-                    if attempt == 0:  # Only print once
+                    if poll_count == 0:  # Only print once
                         print(f"  Warning: Error checking status: {status_response.status_code}")
                         print(f"  Response: {error_msg}")
                         print(f"  Will continue checking status...")
-                    attempt += 1
-                    time.sleep(10)
+                    time.sleep(self._next_delay(poll_count, status_response))
+                    poll_count += 1
                     continue
                 else:
                     print(f"  Warning: Error checking status: {status_response.status_code}")
-                    print(f"  Response: {status_response.text}")
+                    if _DEBUG:
+                        print(f"  Response: {status_response.text}")
                     # Continue trying instead of breaking
-                    attempt += 1
-                    time.sleep(10)
+                    time.sleep(self._next_delay(poll_count, status_response))
+                    poll_count += 1
                     continue
             
-            if attempt >= max_attempts:
+            if timed_out:
                 if not status_checked:
                     print(f"  [ERROR] Could not check video processing status")
                     print(f"  Container ID: {container_id}")
@@ -570,31 +859,61 @@ class InstagramUploader(BaseUploader):
     def get_upload_status(self, container_id: str) -> Optional[Dict]:
         """
         Get the status of an uploaded reel container.
-        
+
+        A single ID is just the N=1 case of the batched ?ids= read, so
+        this delegates rather than keeping a second request path.
+
         Args:
             container_id: Instagram container ID
-            
+
         Returns:
             Dictionary with container status information
         """
+        return self.get_upload_status_batch([container_id]).get(container_id)
+
+    def get_upload_status_batch(self, container_ids: list) -> Dict:
+        """
+        Get the status of several uploaded reel containers at once.
+
+        The Graph API supports batched reads (?ids=<id1>,<id2>,...), so
+        N status checks cost a single round-trip and a single token
+        from the rate-limit bucket instead of N.
+
+        Args:
+            container_ids: List of Instagram container IDs
+
+        Returns:
+            Dictionary mapping container_id to its status dict
+            (or None for containers whose check failed)
+        """
+        if not container_ids:
+            return {}
+
         if not self.authenticated:
             if not self.authenticate():
-                return None
-        
+                return {container_id: None for container_id in container_ids}
+
         try:
-            response = requests.get(
-                f"{self.api_base}/{container_id}",
-                params={
-                    "access_token": self.access_token,
-                    "fields": "status_code"
-                }
-            )
-            
+            with self._bucket:
+                response = self.session.get(
+                    self.api_base,
+                    params={
+                        'ids': ','.join(container_ids),
+                        'fields': 'status_code,status',
+                        'access_token': self.access_token
+                    },
+                    timeout=HTTP_TIMEOUT
+                )
+
             if response.status_code == 200:
-                return response.json()
-            return None
-            
+                payload = _parse_json(response)
+                return {
+                    container_id: payload.get(container_id)
+                    for container_id in container_ids
+                }
+
         except Exception as e:
-            print(f"  Error getting upload status: {e}")
-            return None
+            print(f"  Error getting batch upload status: {e}")
+
+        return {container_id: None for container_id in container_ids}
 
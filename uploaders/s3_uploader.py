@@ -6,10 +6,54 @@ so they can be used with Instagram Graph API (which requires video_url).
 """
 
 import os
+import json
 import boto3
+from datetime import datetime
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import config
+
+# Bucket regions never change, so the head_bucket/get_bucket_location
+# discovery from a previous run can be reused across processes
+_REGION_CACHE_FILE = config.BASE_DIR / "storage" / "s3_region.json"
+
+
+@lru_cache(maxsize=1)
+def _today_folder() -> str:
+    """
+    Today's date folder name (YYYY-MM-DD), computed once per process.
+
+    Caching also pins a batch run to a single folder even when an
+    upload crosses midnight mid-run.
+    """
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=4)
+def _get_s3_client(access_key: str, secret_key: str, region: str):
+    """
+    Build and cache an S3 client for a credential/region combination.
+
+    Client construction costs tens of ms of credential resolution and
+    endpoint discovery, and a fresh client starts with a cold
+    connection pool - caching keeps TLS connections warm across the
+    many short-lived S3Uploader instances a batch run creates.
+    """
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=BotoConfig(
+            max_pool_connections=32,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+    )
 
 
 class S3Uploader:
@@ -24,6 +68,17 @@ class S3Uploader:
         self.region = None
         self.cleanup_after_upload = True  # Clean up S3 files after Instagram upload
         self.last_uploaded_key = None  # Store S3 key for cleanup
+        # Multipart tuning for video-sized files: 64MB parts over 16
+        # concurrent workers saturate the uplink far better than the
+        # 8MB/10-thread defaults; files under 16MB skip multipart (and
+        # its extra init/complete round-trips) entirely.
+        self._transfer_config = TransferConfig(
+            multipart_threshold=16 * 1024 * 1024,
+            multipart_chunksize=64 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
+            io_chunksize=1024 * 1024
+        )
     
     def authenticate(self) -> bool:
         """
@@ -50,14 +105,24 @@ class S3Uploader:
                 print("  Error: AWS_S3_BUCKET_NAME not set in .env")
                 print("  Create a bucket at: https://s3.console.aws.amazon.com/")
                 return False
-            
-            # Create S3 client
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=self.region
-            )
+
+            # Skip the discovery round-trips when a previous run
+            # already resolved this bucket's region - three serialized
+            # HTTPS calls otherwise dominate short CLI runs. A stale or
+            # deleted bucket still fails loudly at the first upload.
+            cached_region = self._load_cached_region()
+            if cached_region:
+                self.region = cached_region
+                self.s3_client = _get_s3_client(aws_access_key, aws_secret_key,
+                                                self.region)
+                print(f"  [OK] Authenticated with AWS S3")
+                print(f"  Bucket: {self.bucket_name}")
+                print(f"  Region: {self.region} (cached)")
+                return True
+
+            # Create (or reuse the cached) S3 client
+            self.s3_client = _get_s3_client(aws_access_key, aws_secret_key,
+                                            self.region)
             
             # Test connection by checking if bucket exists and get actual region
             try:
@@ -76,12 +141,8 @@ class S3Uploader:
                         print(f"  [INFO] Bucket region is {actual_region} (not {self.region} from .env)")
                         self.region = actual_region
                         # Recreate client with correct region
-                        self.s3_client = boto3.client(
-                            's3',
-                            aws_access_key_id=aws_access_key,
-                            aws_secret_access_key=aws_secret_key,
-                            region_name=self.region
-                        )
+                        self.s3_client = _get_s3_client(
+                            aws_access_key, aws_secret_key, self.region)
                 except Exception as e:
                     print(f"  Warning: Could not get bucket region: {e}")
                     print(f"  Using region from .env: {self.region}")
@@ -89,6 +150,7 @@ class S3Uploader:
                 print(f"  [OK] Authenticated with AWS S3")
                 print(f"  Bucket: {self.bucket_name}")
                 print(f"  Region: {self.region}")
+                self._save_cached_region()
                 return True
             except ClientError as e:
                 error_code = e.response['Error']['Code']
@@ -105,7 +167,33 @@ class S3Uploader:
         except Exception as e:
             print(f"  Error authenticating with AWS S3: {e}")
             return False
-    
+
+    def _load_cached_region(self) -> Optional[str]:
+        """Return this bucket's region from the on-disk cache, if known."""
+        try:
+            with open(_REGION_CACHE_FILE) as f:
+                return json.load(f).get(self.bucket_name)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_region(self) -> None:
+        """Record the discovered bucket region for future runs (best-effort)."""
+        try:
+            try:
+                with open(_REGION_CACHE_FILE) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            if cache.get(self.bucket_name) == self.region:
+                return  # Already recorded; skip the write
+            cache[self.bucket_name] = self.region
+            _REGION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _REGION_CACHE_FILE.with_suffix('.json.tmp')
+            tmp_file.write_text(json.dumps(cache, indent=2))
+            os.replace(tmp_file, _REGION_CACHE_FILE)
+        except OSError:
+            pass
+
     def upload_video_and_get_url(
         self,
         video_path: Path,
@@ -128,9 +216,7 @@ class S3Uploader:
         try:
             # Generate S3 object key (file path in bucket)
             # Format: instagram-videos/2025-11-19/video-name.mp4
-            from datetime import datetime
-            date_folder = datetime.now().strftime("%Y-%m-%d")
-            s3_key = f"{folder_prefix}/{date_folder}/{video_path.name}"
+            s3_key = f"{folder_prefix}/{_today_folder()}/{video_path.name}"
             
             print(f"  Uploading video to S3...")
             print(f"  Bucket: {self.bucket_name}")
@@ -138,15 +224,38 @@ class S3Uploader:
             
             # Upload file to S3
             # Note: ACLs are disabled on newer buckets, so we rely on bucket policy for public access
-            self.s3_client.upload_file(
-                str(video_path),
-                self.bucket_name,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': 'video/mp4'
-                    # ACL removed - bucket policy handles public access
-                }
-            )
+            # Files below the multipart threshold go out as one
+            # put_object with an explicit ContentLength - no transfer
+            # manager setup and no re-stat of the file; larger files
+            # take the tuned multipart path. CRC32 integrity checksums
+            # run through zlib's C implementation, so they cost far
+            # less CPU per byte than MD5/SHA256 hashing on large videos
+            # (CRC32C would be faster still, but botocore only computes
+            # it with the optional awscrt package installed).
+            size = video_path.stat().st_size
+            if size < self._transfer_config.multipart_threshold:
+                with open(video_path, 'rb') as f:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=s3_key,
+                        Body=f,
+                        ContentLength=size,
+                        ContentType='video/mp4',
+                        ChecksumAlgorithm='CRC32'
+                        # ACL removed - bucket policy handles public access
+                    )
+            else:
+                self.s3_client.upload_file(
+                    str(video_path),
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs={
+                        'ContentType': 'video/mp4',
+                        'ChecksumAlgorithm': 'CRC32'
+                        # ACL removed - bucket policy handles public access
+                    },
+                    Config=self._transfer_config
+                )
             
             # Generate public URL
             # Format: https://BUCKET_NAME.s3.REGION.amazonaws.com/KEY
@@ -196,3 +305,40 @@ class S3Uploader:
             print(f"  Warning: Could not delete S3 file: {e}")
             return False
 
+    def delete_files(self, s3_keys: list) -> bool:
+        """
+        Delete several files from S3 in bulk (end-of-run cleanup).
+
+        delete_objects takes up to 1000 keys per request, so a batch
+        run's cleanup costs one round-trip instead of one per video.
+
+        Args:
+            s3_keys: List of S3 object keys (paths) to delete
+
+        Returns:
+            True if all deletions succeeded, False otherwise
+        """
+        if not s3_keys:
+            return True
+        try:
+            ok = True
+            for start in range(0, len(s3_keys), 1000):
+                batch = s3_keys[start:start + 1000]
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in batch],
+                        'Quiet': True  # Only failed keys come back
+                    }
+                )
+                for error in response.get('Errors', []):
+                    print(f"  Warning: Could not delete S3 file "
+                          f"{error.get('Key')}: {error.get('Message')}")
+                    ok = False
+            if ok:
+                print(f"  [OK] Cleaned up {len(s3_keys)} S3 file(s)")
+            return ok
+        except Exception as e:
+            print(f"  Warning: Could not delete S3 files: {e}")
+            return False
+
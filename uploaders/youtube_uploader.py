@@ -29,6 +29,11 @@ class YouTubeUploader(BaseUploader):
     
     # YouTube API scopes required for uploading
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+
+    # token file path -> Credentials, shared across instances so repeat
+    # authenticate() calls skip the disk read + JSON decode and just
+    # check validity (refreshing in place when expired)
+    _cached_creds = {}
     
     def __init__(self):
         super().__init__("YouTube")
@@ -43,12 +48,12 @@ class YouTubeUploader(BaseUploader):
             True if authentication successful, False otherwise
         """
         try:
-            creds = None
             token_file = config.BASE_DIR / "storage" / "tokens" / "youtube_token.json"
             token_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Load existing token if available
-            if token_file.exists():
+            # Load existing token if available (cache first, then disk)
+            creds = YouTubeUploader._cached_creds.get(token_file)
+            if creds is None and token_file.exists():
                 creds = Credentials.from_authorized_user_file(str(token_file), self.SCOPES)
             
             # If no valid credentials, get new ones
@@ -67,12 +72,27 @@ class YouTubeUploader(BaseUploader):
                         client_secrets_file, self.SCOPES)
                     creds = flow.run_local_server(port=0)
                 
-                # Save credentials for next time
-                with open(token_file, 'w') as token:
-                    token.write(creds.to_json())
+                # Save credentials for next time. Write-to-temp +
+                # rename is atomic, and identical content (token didn't
+                # actually change) skips the disk write entirely.
+                new_json = creds.to_json()
+                try:
+                    unchanged = token_file.read_text() == new_json
+                except OSError:
+                    unchanged = False
+                if not unchanged:
+                    tmp_file = token_file.with_suffix('.json.tmp')
+                    tmp_file.write_text(new_json)
+                    os.replace(tmp_file, token_file)
             
+            YouTubeUploader._cached_creds[token_file] = creds
             self.credentials = creds
-            self.service = build('youtube', 'v3', credentials=creds)
+            # cache_discovery=False skips the discovery disk-cache IO
+            # (and its oauth2client warning); static_discovery serves
+            # the API description from the bundled document instead of
+            # fetching it over HTTPS on every build.
+            self.service = build('youtube', 'v3', credentials=creds,
+                                 cache_discovery=False, static_discovery=True)
             self.authenticated = True
             print(f"  [OK] Authenticated with YouTube API")
             return True
@@ -127,13 +147,15 @@ class YouTubeUploader(BaseUploader):
             # Upload as regular YouTube video (not Shorts)
             # Title is used as-is without #Shorts tag
             
-            # Upload video
+            # Upload video. A finite 16MB chunk bounds memory (chunksize=-1
+            # buffers the whole file in one request) and lets a failed
+            # chunk be retried without restarting the upload.
             print(f"  Uploading to YouTube...")
             media = MediaFileUpload(
                 str(video_path),
-                chunksize=-1,
+                chunksize=16 * 1024 * 1024,
                 resumable=True,
-                mimetype='video/*'
+                mimetype='video/mp4'
             )
             
             insert_request = self.service.videos().insert(
@@ -142,13 +164,21 @@ class YouTubeUploader(BaseUploader):
                 media_body=media
             )
             
-            # Execute upload with progress tracking
+            # Execute upload with progress tracking. num_retries gives
+            # each chunk the client library's built-in exponential
+            # backoff on 5xx/transient errors instead of failing the
+            # whole upload.
+            # With 16MB chunks a long video yields many next_chunk
+            # calls, so only print when progress moved at least 5%.
             response = None
+            last_printed = -5
             while response is None:
-                status, response = insert_request.next_chunk()
+                status, response = insert_request.next_chunk(num_retries=3)
                 if status:
                     progress = int(status.progress() * 100)
-                    print(f"  Upload progress: {progress}%")
+                    if progress - last_printed >= 5:
+                        print(f"  Upload progress: {progress}%")
+                        last_printed = progress
             
             if 'id' in response:
                 video_id = response['id']
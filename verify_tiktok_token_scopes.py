@@ -4,6 +4,7 @@ Verify TikTok token and check what scopes are actually authorized.
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import json
 
@@ -20,15 +21,42 @@ print("=" * 70)
 print("TikTok Token Scope Verification")
 print("=" * 70)
 
+# The two probes are independent, so fire them concurrently on one
+# keep-alive session - the second no longer waits a full round-trip
+# behind the first, and both share the TLS handshake.
+session = requests.Session()
+session.headers["Authorization"] = f"Bearer {access_token}"
+
+with ThreadPoolExecutor(max_workers=2) as pool:
+    user_future = pool.submit(
+        session.get,
+        "https://open.tiktokapis.com/v2/user/info/",
+        params={"fields": "open_id,union_id,avatar_url,display_name"}
+    )
+    scope_future = pool.submit(
+        session.post,
+        "https://open.tiktokapis.com/v2/post/publish/video/init/",
+        json={
+            "post_info": {
+                "title": "Scope Test",
+                "description": "Testing video.upload scope",
+                "privacy_level": "SELF_ONLY",
+                "disable_duet": False,
+                "disable_comment": False,
+                "disable_stitch": False,
+                "video_cover_timestamp_ms": 1000
+            },
+            "source_info": {
+                "source": "FILE_UPLOAD"
+            }
+        }
+    )
+
 # Check token validity and get user info
 print("\n1. Checking Token Validity...")
 print("-" * 70)
 
-response = requests.get(
-    "https://open.tiktokapis.com/v2/user/info/",
-    headers={"Authorization": f"Bearer {access_token}"},
-    params={"fields": "open_id,union_id,avatar_url,display_name"}
-)
+response = user_future.result()
 
 if response.status_code == 200:
     data = response.json()
@@ -50,29 +78,9 @@ print("-" * 70)
 # Test user.info.basic scope (we already know this works)
 print("[OK] user.info.basic scope: WORKING (we can get user info)")
 
-# Test video.upload scope
+# Test video.upload scope (probe already in flight)
 print("\nTesting video.upload scope...")
-test_response = requests.post(
-    "https://open.tiktokapis.com/v2/post/publish/video/init/",
-    headers={
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    },
-    json={
-        "post_info": {
-            "title": "Scope Test",
-            "description": "Testing video.upload scope",
-            "privacy_level": "SELF_ONLY",
-            "disable_duet": False,
-            "disable_comment": False,
-            "disable_stitch": False,
-            "video_cover_timestamp_ms": 1000
-        },
-        "source_info": {
-            "source": "FILE_UPLOAD"
-        }
-    }
-)
+test_response = scope_future.result()
 
 print(f"Response Status: {test_response.status_code}")
 